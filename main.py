@@ -5,6 +5,7 @@ Ultra-performant scraper for 202 Crete event sources
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import sys
@@ -64,6 +65,9 @@ class CreteScraper:
         self.facebook_scraper = None
         self.web_scraper = None
 
+        # Health check results gathered up front for website sources
+        self.source_health: Dict[str, bool] = {}
+
         # Storage
         self.all_events = []
         self.failed_sources = []
@@ -183,13 +187,8 @@ class CreteScraper:
         events = []
 
         try:
-            # Health check
-            if self.config.get('health_check', {}).get('enabled', True):
-                if source_type == 'Website':
-                    if not self.web_scraper.health_check(source_url):
-                        self.logger.warning(f"Health check failed for {source_url}")
-                        if self.config['health_check'].get('skip_failed_sources', True):
-                            return events
+            if not self._is_source_healthy(source):
+                return events
 
             # Scrape based on type
             if source_type == 'Facebook':
@@ -197,30 +196,131 @@ class CreteScraper:
             else:
                 events = self._scrape_web_source(source)
 
-            # Add source metadata to events
-            for event in events:
-                event['source_name'] = source_name
-                event['source_url'] = source_url
-                event['source_id'] = source_id
-
-            # Cache results
-            if events:
-                self.cache_manager.cache_source_events(source_id, events)
-
-            self.logger.info(f"✓ {source_name}: {len(events)} events")
-            self.stats['sources_scraped'] += 1
+            self._finish_source(source, events)
 
         except Exception as e:
-            self.logger.error(f"✗ Failed to scrape {source_name}: {e}")
-            self.failed_sources.append({
-                'source_id': source_id,
-                'source_name': source_name,
-                'error': str(e)
-            })
-            self.stats['sources_failed'] += 1
+            self._record_failure(source, e)
 
         return events
 
+    def scrape_web_sources(self, sources: List[Dict]) -> List[Dict]:
+        """
+        Scrape website sources together in concurrent batches
+
+        Static pages share one async HTTP client; pages that need a browser
+        are rendered with Playwright, falling back to Selenium.
+
+        Args:
+            sources: List of website sources
+
+        Returns:
+            List of events
+        """
+        all_events = []
+        pending = []
+
+        for source in sources:
+            cached_events = self.cache_manager.get_cached_source_events(source.get('source_id', 'unknown'))
+            if cached_events:
+                all_events.extend(cached_events)
+            elif self._is_source_healthy(source):
+                pending.append(source)
+
+        if not pending:
+            return all_events
+
+        for use_selenium in (False, True):
+            batch = [source for source in pending if self._requires_selenium(source) == use_selenium]
+            if not batch:
+                continue
+
+            urls = list(dict.fromkeys(source['source_url'] for source in batch))
+            self.logger.info(f"Scraping {len(urls)} websites concurrently (selenium={use_selenium})")
+
+            try:
+                results = self._get_web_scraper().scrape_urls(urls, use_selenium=use_selenium)
+            except Exception as e:
+                for source in batch:
+                    self._record_failure(source, e)
+                continue
+
+            for source in batch:
+                # Copy so sources sharing a URL don't overwrite each other's metadata
+                events = [dict(event) for event in results.get(source['source_url'], [])]
+                self._finish_source(source, events)
+                all_events.extend(events)
+
+        return all_events
+
+    def _is_source_healthy(self, source: Dict) -> bool:
+        """
+        Check whether a source should be scraped, using the up-front health results
+
+        Args:
+            source: Source dictionary
+
+        Returns:
+            False if the source failed its health check and should be skipped
+        """
+        health_config = self.config.get('health_check', {})
+        if not health_config.get('enabled', True):
+            return True
+
+        source_url = source.get('source_url', '')
+        if source.get('source_type', 'Website') != 'Website':
+            return True
+
+        healthy = self.source_health.get(source_url)
+        if healthy is None:
+            healthy = self._get_web_scraper().health_check(source_url)
+        if not healthy:
+            self.logger.warning(f"Health check failed for {source_url}")
+            return not health_config.get('skip_failed_sources', True)
+
+        return True
+
+    def _finish_source(self, source: Dict, events: List[Dict]):
+        """
+        Tag scraped events with their source, cache them and update stats
+
+        Args:
+            source: Source dictionary
+            events: Events scraped from the source
+        """
+        source_id = source.get('source_id', 'unknown')
+        source_name = source.get('source_name', 'Unknown')
+
+        # Add source metadata to events
+        for event in events:
+            event['source_name'] = source_name
+            event['source_url'] = source.get('source_url', '')
+            event['source_id'] = source_id
+
+        # Cache results
+        if events:
+            self.cache_manager.cache_source_events(source_id, events)
+
+        self.logger.info(f"✓ {source_name}: {len(events)} events")
+        self.stats['sources_scraped'] += 1
+
+    def _record_failure(self, source: Dict, error: Exception):
+        """
+        Record a source that failed to scrape
+
+        Args:
+            source: Source dictionary
+            error: Exception raised while scraping
+        """
+        source_name = source.get('source_name', 'Unknown')
+
+        self.logger.error(f"✗ Failed to scrape {source_name}: {error}")
+        self.failed_sources.append({
+            'source_id': source.get('source_id', 'unknown'),
+            'source_name': source_name,
+            'error': str(error)
+        })
+        self.stats['sources_failed'] += 1
+
     def _scrape_facebook_source(self, source: Dict) -> List[Dict]:
         """
         Scrape Facebook source
@@ -250,17 +350,65 @@ class CreteScraper:
         Returns:
             List of events
         """
+        return self._get_web_scraper().scrape_url(
+            source['source_url'], use_selenium=self._requires_selenium(source)
+        )
+
+    def _requires_selenium(self, source: Dict) -> bool:
+        """
+        Check if a website source must be rendered in a browser
+
+        Args:
+            source: Source dictionary
+
+        Returns:
+            True if the source requires Selenium
+        """
+        return source.get('requires_selenium', '').lower() == 'yes'
+
+    def _get_web_scraper(self) -> WebScraper:
+        """
+        Get the web scraper, initializing it on first use
+
+        Returns:
+            WebScraper instance
+        """
         if not self.web_scraper:
             # Initialize web scraper
             if not self.selenium_manager:
                 self.selenium_manager = SeleniumManager(self.config)
 
-            self.web_scraper = WebScraper(self.selenium_manager, self.config)
+            self.web_scraper = WebScraper(self.selenium_manager, self.config, self.cache_manager)
+
+        return self.web_scraper
 
-        # Check if Selenium is required
-        use_selenium = source.get('requires_selenium', '').lower() == 'yes'
+    def check_sources_health(self, sources: List[Dict]):
+        """
+        Health-check all website sources concurrently before scraping
 
-        return self.web_scraper.scrape_url(source['source_url'], use_selenium=use_selenium)
+        Args:
+            sources: List of sources
+        """
+        health_config = self.config.get('health_check', {})
+        if not health_config.get('enabled', True):
+            return
+
+        # Sources served from the event cache are never fetched, so skip them
+        urls = list(dict.fromkeys(
+            source.get('source_url', '') for source in sources
+            if source.get('source_type', 'Website') == 'Website' and source.get('source_url')
+            and not self.cache_manager.has_cached_source_events(source.get('source_id', 'unknown'))
+        ))
+        if not urls:
+            return
+
+        self.logger.info(f"Health-checking {len(urls)} website sources")
+        self.source_health = asyncio.run(
+            self._get_web_scraper().health_check_many(urls, timeout=health_config.get('timeout', 5))
+        )
+
+        dead = sum(1 for healthy in self.source_health.values() if not healthy)
+        self.logger.info(f"Health check complete: {len(urls) - dead} reachable, {dead} unreachable")
 
     def scrape_all_sources(self, sources: List[Dict], max_workers: int = 5):
         """
@@ -274,19 +422,29 @@ class CreteScraper:
 
         self.logger.info(f"Starting scraping with {max_workers} workers")
 
+        # Check every website at once instead of one HEAD per source in turn
+        self.check_sources_health(sources)
+
         # Use ThreadPoolExecutor for parallel scraping
         use_multithreading = self.config.get('performance', {}).get('use_multithreading', True)
 
         if use_multithreading and max_workers > 1:
+            # Websites are fetched in async batches; Facebook pages go to the pool
+            web_sources = [source for source in sources if self._is_batched_source(source)]
+            if web_sources:
+                self.all_events.extend(self.scrape_web_sources(web_sources))
+
+            pool_sources = [source for source in sources if not self._is_batched_source(source)]
+
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit all tasks
                 future_to_source = {
                     executor.submit(self.scrape_source, source): source
-                    for source in sources
+                    for source in pool_sources
                 }
 
                 # Progress bar
-                with tqdm(total=len(sources), desc="Scraping sources") as pbar:
+                with tqdm(total=len(pool_sources), desc="Scraping sources") as pbar:
                     for future in as_completed(future_to_source):
                         source = future_to_source[future]
                         try:
@@ -305,6 +463,18 @@ class CreteScraper:
         self.stats['events_total'] = len(self.all_events)
         self.logger.info(f"Scraping complete: {self.stats['events_total']} events from {len(sources)} sources")
 
+    def _is_batched_source(self, source: Dict) -> bool:
+        """
+        Check whether a source is fetched in the concurrent website batches
+
+        Args:
+            source: Source dictionary
+
+        Returns:
+            True for every source that isn't a Facebook page
+        """
+        return source.get('source_type', 'Website') != 'Facebook'
+
     def process_events(self):
         """
         Process all scraped events (clean, validate, translate, geocode)
@@ -432,6 +602,9 @@ class CreteScraper:
         if self.cache_manager:
             self.cache_manager.cleanup_expired()
 
+        if self.translator:
+            self.translator.close()
+
     def run(self, max_workers: int = 5):
         """
         Run the complete scraping pipeline
@@ -52,6 +52,7 @@ pip install -r requirements.txt --quiet
 
 if [ $? -eq 0 ]; then
     echo "✓ All dependencies installed successfully"
+    playwright install chromium
 else
     echo "✗ Failed to install some dependencies"
     echo "Please check the error messages above"
@@ -71,7 +71,7 @@ class CacheManager:
         Returns:
             Cached value or default
         """
-        if not self.cache:
+        if self.cache is None:
             return default
 
         try:
@@ -92,7 +92,7 @@ class CacheManager:
             value: Value to cache
             expire: Expiration time in seconds (uses default TTL if None)
         """
-        if not self.cache:
+        if self.cache is None:
             return
 
         try:
@@ -111,7 +111,7 @@ class CacheManager:
         Args:
             key: Cache key
         """
-        if not self.cache:
+        if self.cache is None:
             return
 
         try:
@@ -124,7 +124,7 @@ class CacheManager:
         """
         Clear all cache
         """
-        if not self.cache:
+        if self.cache is None:
             return
 
         try:
@@ -323,6 +323,19 @@ class CacheManager:
         }
         self.set(cache_key, cache_data, expire=expire)
 
+    def has_cached_source_events(self, source_id: str) -> bool:
+        """
+        Check whether a source has cached events, without logging a cache hit
+
+        Args:
+            source_id: Source identifier
+
+        Returns:
+            True if cached events exist
+        """
+        cache_data = self.get(f"source:{source_id}")
+        return isinstance(cache_data, dict) and bool(cache_data.get('events'))
+
     def get_cached_source_events(self, source_id: str) -> Optional[list]:
         """
         Get cached events from a source
@@ -356,7 +369,7 @@ class CacheManager:
         Returns:
             Dictionary with cache stats
         """
-        if not self.cache:
+        if self.cache is None:
             return {'enabled': False}
 
         stats = {
@@ -372,7 +385,7 @@ class CacheManager:
         """
         Clean up expired cache entries
         """
-        if not self.cache:
+        if self.cache is None:
             return
 
         try:
@@ -445,5 +458,5 @@ class CacheManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        if self.cache:
+        if self.cache is not None:
             self.cache.close()
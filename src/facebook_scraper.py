@@ -7,18 +7,35 @@ import logging
 import pickle
 import time
 import re
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from bs4 import BeautifulSoup
 
 from .selenium_manager import SeleniumManager
 
 
+# Elements Facebook typically uses for event date/time text
+_DATE_SELECTOR = 'time, abbr, span[class*="time" i], span[aria-label*="event" i]'
+
+# Number of text nodes read from a container for date/location extraction
+_MAX_CONTAINER_STRINGS = 40
+
+# Location keywords in priority order; words must stand alone so that
+# "Berlin" or "Beat" don't count as "in"/"at"
+_LOCATION_KEYWORD_RES = (
+    re.compile(r'(?:^|\s)at(?:\s|$)'),
+    re.compile(r'(?:^|\s)in(?:\s|$)'),
+    re.compile(r'·'),
+)
+
+
 class FacebookScraper:
     """
     Scrapes public events from Facebook pages
@@ -74,9 +91,8 @@ class FacebookScraper:
             with open(self.cookies_file, 'rb') as f:
                 cookies = pickle.load(f)
 
-            # Navigate to Facebook first
+            # Navigate to Facebook first (cookies can only be set for the current domain)
             driver.get("https://www.facebook.com")
-            time.sleep(2)
 
             # Add cookies
             for cookie in cookies:
@@ -87,7 +103,9 @@ class FacebookScraper:
 
             # Refresh page to apply cookies
             driver.refresh()
-            time.sleep(3)
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
 
             # Check if logged in
             if self._is_logged_in():
@@ -111,27 +129,9 @@ class FacebookScraper:
         """
         try:
             driver = self.selenium_manager.get_driver()
-            page_source = driver.page_source.lower()
-
-            # Check for login indicators
-            logged_in_indicators = [
-                'logout',
-                'log out',
-                'account settings',
-                'profile_icon'
-            ]
-
-            logged_out_indicators = [
-                'create new account',
-                'sign up',
-                'forgotten password'
-            ]
-
-            has_logged_in = any(indicator in page_source for indicator in logged_in_indicators)
-            has_logged_out = any(indicator in page_source for indicator in logged_out_indicators)
-
-            return has_logged_in and not has_logged_out
-
+            # Facebook sets the c_user cookie only for authenticated sessions,
+            # which avoids serializing the whole page source
+            return driver.get_cookie('c_user') is not None
         except Exception as e:
             self.logger.error(f"Error checking login status: {e}")
             return False
@@ -159,7 +159,7 @@ class FacebookScraper:
 
             # Navigate to login page
             driver.get(login_url)
-            time.sleep(3)
+            self.selenium_manager.wait_for_element(By.CSS_SELECTOR, '#email, input[name="email"]')
 
             # Find email and password fields
             try:
@@ -320,22 +320,12 @@ class FacebookScraper:
         Returns:
             List of event container elements
         """
-        containers = []
-
-        # Try various selectors (Facebook changes these frequently)
-        selectors = [
-            {'role': 'article'},
-            {'data-testid': lambda x: x and 'event' in x.lower()},
-            {'class': lambda x: x and 'event' in ' '.join(x).lower()}
-        ]
-
-        for selector in selectors:
-            found = soup.find_all('div', selector)
-            if found:
-                containers.extend(found)
-
-        # Remove duplicates
-        containers = list(set(containers))
+        # Try various selectors (Facebook changes these frequently).
+        # A single select() runs in soupsieve, returning unique matches in
+        # document order without per-tag Python callbacks.
+        containers = soup.select(
+            'div[role="article"], div[data-testid*="event" i], div[class*="event" i]'
+        )
 
         return containers
 
@@ -380,23 +370,26 @@ class FacebookScraper:
             if img_elem:
                 event['image_url'] = img_elem['src']
 
+            # Only the leading text nodes are needed for date/location, so avoid
+            # walking the whole subtree with get_text()
+            strings = list(islice(container.stripped_strings, _MAX_CONTAINER_STRINGS))
+            text = ' '.join(strings)
+
             # Extract date/time (this is complex and may need adjustment)
-            text = container.get_text()
-            date_match = self._extract_date_from_text(text)
+            date_elems = container.select(_DATE_SELECTOR, limit=5)
+            date_text = ' '.join(elem.get_text(' ', strip=True) for elem in date_elems) or text
+            date_match = self._extract_date_from_text(date_text)
+            if not date_match and date_text is not text:
+                # The matched elements held labels, not dates: scan the whole container
+                date_match = self._extract_date_from_text(text)
             if date_match:
                 event['start_date'] = date_match
 
             # Extract location
-            location_keywords = ['at ', 'in ', '·']
-            for keyword in location_keywords:
-                if keyword in text:
-                    parts = text.split(keyword)
-                    if len(parts) > 1:
-                        event['venue_name'] = parts[1].split('\n')[0].strip()
-                        break
+            event['venue_name'] = self._extract_location(strings)
 
             # Extract description (usually not visible in event list, would need to visit event page)
-            desc_elem = container.find(['p', 'span'], {'class': lambda x: x and 'description' in ' '.join(x).lower()})
+            desc_elem = container.select_one('p[class*="description" i], span[class*="description" i]')
             if desc_elem:
                 event['description'] = desc_elem.get_text(strip=True)
 
@@ -405,6 +398,31 @@ class FacebookScraper:
 
         return event
 
+    def _extract_location(self, strings: List[str]) -> Optional[str]:
+        """
+        Extract the venue following a location keyword
+
+        Args:
+            strings: Stripped text nodes of the event container
+
+        Returns:
+            Venue name or None
+        """
+        for keyword_re in _LOCATION_KEYWORD_RES:
+            for index, string in enumerate(strings):
+                match = keyword_re.search(string)
+                if not match:
+                    continue
+
+                # The venue is the rest of this node, or the next node when
+                # the keyword ends it ("at " + <a>Venue</a>, or a lone "·")
+                venue = string[match.end():].strip()
+                if not venue and index + 1 < len(strings):
+                    venue = strings[index + 1]
+                return venue or None
+
+        return None
+
     def _extract_date_from_text(self, text: str) -> Optional[str]:
         """
         Extract date from text using regex patterns
@@ -473,12 +491,12 @@ class FacebookScraper:
                 event['title'] = title_elem.get_text(strip=True)
 
             # Extract description
-            desc_elem = soup.find('div', {'data-testid': lambda x: x and 'event-description' in x.lower()})
+            desc_elem = soup.select_one('div[data-testid*="event-description" i]')
             if desc_elem:
                 event['description'] = desc_elem.get_text(strip=True)
 
             # Extract image
-            img_elem = soup.find('img', {'data-testid': lambda x: x and 'event' in x.lower()})
+            img_elem = soup.select_one('img[data-testid*="event" i]')
             if img_elem and img_elem.get('src'):
                 event['image_url'] = img_elem['src']
 
@@ -8,7 +8,7 @@ import requests
 import hashlib
 import os
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 import time
 
@@ -16,6 +16,10 @@ from PIL import Image
 import io
 
 
+# Characters not allowed in filenames, mapped to '_' in a single pass
+_INVALID_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 class ImageHandler:
     """
     Handles image downloading and processing for events
@@ -39,10 +43,19 @@ class ImageHandler:
         self.medium_dir = self.base_dir / 'medium'
         self.thumb_dir = self.base_dir / 'thumbnail'
 
+        self.image_dirs = {
+            'full': self.full_dir,
+            'medium': self.medium_dir,
+            'thumb': self.thumb_dir
+        }
+
         # Ensure directories exist
-        for directory in [self.full_dir, self.medium_dir, self.thumb_dir]:
+        for directory in self.image_dirs.values():
             directory.mkdir(parents=True, exist_ok=True)
 
+        # Running image counters (one scan at startup, then updated incrementally)
+        self._stats = self._scan_stats()
+
         # Image sizes
         self.sizes = self.image_config.get('sizes', {
             'full': [1200, 800],
@@ -56,6 +69,9 @@ class ImageHandler:
         self.quality = self.image_config.get('quality', 85)
         self.allowed_formats = self.image_config.get('allowed_formats', ['jpg', 'jpeg', 'png', 'webp'])
         self.convert_to_jpg = self.image_config.get('convert_to_jpg', True)
+        self.head_precheck = self.image_config.get('head_precheck', True)
+        self.small_file_size = self.image_config.get('small_file_size_kb', 256) * 1024
+        self.reuse_ttl = self.image_config.get('reuse_ttl_hours', 24) * 3600
 
         # Session for downloads
         self.session = requests.Session()
@@ -105,6 +121,22 @@ class ImageHandler:
             return result
 
         try:
+            # Generate filenames (URL hash makes a changed image_url trigger a re-download)
+            safe_id = self._sanitize_filename(event_id)
+            url_hash = hashlib.blake2b(image_url.encode(), digest_size=6).hexdigest()
+            full_path = self.full_dir / f"{safe_id}_{url_hash}_full.jpg"
+            medium_path = self.medium_dir / f"{safe_id}_{url_hash}_medium.jpg"
+            thumb_path = self.thumb_dir / f"{safe_id}_{url_hash}_thumb.jpg"
+
+            # Reuse images from a previous run if they are recent enough
+            if self._files_are_fresh([full_path, medium_path, thumb_path]):
+                result['full_path'] = str(full_path)
+                result['medium_path'] = str(medium_path)
+                result['thumbnail_path'] = str(thumb_path)
+                result['success'] = True
+                self.logger.debug(f"Reusing existing images for event {event_id}")
+                return result
+
             self.logger.info(f"Downloading image for event {event_id}: {image_url}")
 
             # Download image
@@ -119,42 +151,54 @@ class ImageHandler:
                 self.logger.error(f"Failed to open image: {e}")
                 return result
 
-            # Convert RGBA to RGB if needed
-            if img.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
-
             # Convert to RGB
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # Generate filenames
-            safe_id = self._sanitize_filename(event_id)
+            img = self._convert_to_rgb(img)
 
             # Save full size
-            full_path = self.full_dir / f"{safe_id}_full.jpg"
+            previous_size = self._file_size(full_path)
             full_img = self._resize_image(img, self.sizes['full'])
-            full_img.save(full_path, 'JPEG', quality=self.quality, optimize=True)
+            full_img.save(
+                full_path, 'JPEG', quality=self.quality,
+                optimize=True, progressive=True, subsampling=2
+            )
+            self._record_saved('full', full_path, previous_size)
             result['full_path'] = str(full_path)
             self.logger.debug(f"Saved full image: {full_path}")
 
-            # Save medium size
-            medium_path = self.medium_dir / f"{safe_id}_medium.jpg"
+            # Smaller sizes are derived from the already downscaled master
+            # when it is large enough, instead of the original
+            if self._fits_within(self.sizes['medium'], self.sizes['full']):
+                img.close()
+                img = full_img
+            else:
+                full_img.close()
+
+            # Save medium size (smaller sizes skip the two-pass Huffman
+            # optimization, which saves little at these dimensions)
+            previous_size = self._file_size(medium_path)
             medium_img = self._resize_image(img, self.sizes['medium'])
-            medium_img.save(medium_path, 'JPEG', quality=self.quality, optimize=True)
+            medium_img.save(medium_path, 'JPEG', quality=self.quality, optimize=False, subsampling=2)
+            self._record_saved('medium', medium_path, previous_size)
             result['medium_path'] = str(medium_path)
             self.logger.debug(f"Saved medium image: {medium_path}")
 
+            if self._fits_within(self.sizes['thumbnail'], self.sizes['medium']):
+                img.close()
+                img = medium_img
+            else:
+                medium_img.close()
+
             # Save thumbnail
-            thumb_path = self.thumb_dir / f"{safe_id}_thumb.jpg"
+            previous_size = self._file_size(thumb_path)
             thumb_img = self._resize_image(img, self.sizes['thumbnail'])
-            thumb_img.save(thumb_path, 'JPEG', quality=self.quality, optimize=True)
+            thumb_img.save(thumb_path, 'JPEG', quality=self.quality, optimize=False, subsampling=2)
+            thumb_img.close()
+            self._record_saved('thumb', thumb_path, previous_size)
             result['thumbnail_path'] = str(thumb_path)
             self.logger.debug(f"Saved thumbnail: {thumb_path}")
 
+            img.close()
+
             result['success'] = True
             self.logger.info(f"Successfully processed image for event {event_id}")
 
@@ -179,12 +223,21 @@ class ImageHandler:
             if referer:
                 headers['Referer'] = referer
 
-            # Stream download to check size
+            # Cheap size pre-check (many CDNs disallow HEAD, so failures are ignored)
+            known_size = None
+            if self.head_precheck:
+                known_size = self._head_content_length(url, headers)
+                if known_size is not None and known_size > self.max_file_size:
+                    self.logger.warning(f"Image too large: {known_size} bytes")
+                    return None
+
+            # Small images are read in one go, others are streamed to check size
+            small = known_size is not None and known_size <= self.small_file_size
             response = self.session.get(
                 url,
                 headers=headers,
                 timeout=self.timeout,
-                stream=True,
+                stream=not small,
                 allow_redirects=True
             )
 
@@ -202,19 +255,25 @@ class ImageHandler:
                 self.logger.warning(f"Image too large: {int(content_length)} bytes")
                 return None
 
-            # Download in chunks
-            chunks = []
-            total_size = 0
-
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    total_size += len(chunk)
-                    if total_size > self.max_file_size:
-                        self.logger.warning("Image exceeded max size during download")
-                        return None
-                    chunks.append(chunk)
-
-            image_data = b''.join(chunks)
+            if small:
+                image_data = response.content
+                if len(image_data) > self.max_file_size:
+                    self.logger.warning("Image exceeded max size during download")
+                    return None
+            else:
+                # Download in chunks
+                chunks = []
+                total_size = 0
+
+                for chunk in response.iter_content(chunk_size=8192):
+                    if chunk:
+                        total_size += len(chunk)
+                        if total_size > self.max_file_size:
+                            self.logger.warning("Image exceeded max size during download")
+                            return None
+                        chunks.append(chunk)
+
+                image_data = b''.join(chunks)
 
             # Small delay to be polite
             time.sleep(0.2)
@@ -225,6 +284,60 @@ class ImageHandler:
             self.logger.error(f"Failed to download image from {url}: {e}")
             return None
 
+    def _convert_to_rgb(self, img: Image.Image) -> Image.Image:
+        """
+        Convert image to RGB, flattening transparency onto a white background
+
+        Intermediate images are closed as soon as they are replaced so their
+        pixel buffers are released without waiting for garbage collection.
+
+        Args:
+            img: PIL Image object
+
+        Returns:
+            RGB PIL Image
+        """
+        if img.mode == 'P':
+            converted = img.convert('RGBA')
+            img.close()
+            img = converted
+
+        if img.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel('A') if img.mode == 'RGBA' else None)
+            img.close()
+            img = background
+
+        if img.mode != 'RGB':
+            converted = img.convert('RGB')
+            img.close()
+            img = converted
+
+        return img
+
+    def _head_content_length(self, url: str, headers: Dict) -> Optional[int]:
+        """
+        Get image size from a HEAD request
+
+        Args:
+            url: Image URL
+            headers: Request headers
+
+        Returns:
+            Content-Length in bytes, or None if unavailable
+        """
+        try:
+            response = self.session.head(url, headers=headers, timeout=5, allow_redirects=True)
+            if not response.ok:
+                return None
+
+            content_length = response.headers.get('Content-Length')
+            return int(content_length) if content_length else None
+
+        except (requests.RequestException, ValueError) as e:
+            self.logger.debug(f"HEAD pre-check failed for {url}: {e}")
+            return None
+
     def _resize_image(self, img: Image.Image, target_size: Tuple[int, int]) -> Image.Image:
         """
         Resize image while maintaining aspect ratio
@@ -253,11 +366,28 @@ class ImageHandler:
         new_width = int(original_width * scale_factor)
         new_height = int(original_height * scale_factor)
 
+        # Large reductions get a cheap BOX pre-reduction so LANCZOS only
+        # runs on the final step (same approach as Image.thumbnail)
+        reducing_gap = 3.0 if scale_factor < 1 / 3 else None
+
         # Resize using high-quality algorithm
-        resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
 
         return resized
 
+    def _fits_within(self, size: Tuple[int, int], bound: Tuple[int, int]) -> bool:
+        """
+        Check whether a target size fits inside another target size
+
+        Args:
+            size: Target (width, height)
+            bound: Bounding (width, height)
+
+        Returns:
+            True if size is no larger than bound in both dimensions
+        """
+        return size[0] <= bound[0] and size[1] <= bound[1]
+
     def _sanitize_filename(self, filename: str) -> str:
         """
         Sanitize filename to remove invalid characters
@@ -269,14 +399,12 @@ class ImageHandler:
             Sanitized filename
         """
         # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        filename = filename.translate(_INVALID_FILENAME_CHARS)
 
         # Limit length
         if len(filename) > 100:
             # Use hash for very long names
-            hash_suffix = hashlib.md5(filename.encode()).hexdigest()[:8]
+            hash_suffix = hashlib.blake2b(filename.encode(), digest_size=4).hexdigest()
             filename = filename[:90] + '_' + hash_suffix
 
         return filename
@@ -376,6 +504,75 @@ class ImageHandler:
 
         return processed_events
 
+    def _scan_stats(self) -> Dict:
+        """
+        Count images and their total size with one directory scan each
+
+        Returns:
+            Dictionary with per-size counts and total bytes
+        """
+        stats = {'full': 0, 'medium': 0, 'thumb': 0, 'total_bytes': 0}
+
+        for key, directory in self.image_dirs.items():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.jpg') and entry.is_file():
+                        stats[key] += 1
+                        stats['total_bytes'] += entry.stat().st_size
+
+        return stats
+
+    def _files_are_fresh(self, paths: List[Path]) -> bool:
+        """
+        Check that all files exist and are newer than the reuse TTL
+
+        Args:
+            paths: File paths to check
+
+        Returns:
+            True if every file can be reused, False otherwise
+        """
+        threshold = time.time() - self.reuse_ttl
+
+        for path in paths:
+            try:
+                if path.stat().st_mtime < threshold:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+    def _file_size(self, path: Path) -> Optional[int]:
+        """
+        Get size of an existing file
+
+        Args:
+            path: File path
+
+        Returns:
+            Size in bytes, or None if the file does not exist
+        """
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return None
+
+    def _record_saved(self, key: str, path: Path, previous_size: Optional[int]):
+        """
+        Update running counters after an image has been written
+
+        Args:
+            key: Size key ('full', 'medium' or 'thumb')
+            path: Path of the saved image
+            previous_size: Size of the file it replaced, or None if new
+        """
+        if previous_size is None:
+            self._stats[key] += 1
+            previous_size = 0
+
+        self._stats['total_bytes'] += os.path.getsize(path) - previous_size
+
     def get_stats(self) -> Dict:
         """
         Get statistics about processed images
@@ -383,22 +580,13 @@ class ImageHandler:
         Returns:
             Dictionary with image statistics
         """
-        stats = {
-            'full_images': len(list(self.full_dir.glob('*.jpg'))),
-            'medium_images': len(list(self.medium_dir.glob('*.jpg'))),
-            'thumbnails': len(list(self.thumb_dir.glob('*.jpg'))),
+        return {
+            'full_images': self._stats['full'],
+            'medium_images': self._stats['medium'],
+            'thumbnails': self._stats['thumb'],
+            'total_size_mb': round(self._stats['total_bytes'] / (1024 * 1024), 2)
         }
 
-        # Calculate total size
-        total_size = 0
-        for directory in [self.full_dir, self.medium_dir, self.thumb_dir]:
-            for img_file in directory.glob('*.jpg'):
-                total_size += img_file.stat().st_size
-
-        stats['total_size_mb'] = round(total_size / (1024 * 1024), 2)
-
-        return stats
-
     def cleanup_old_images(self, days: int = 30):
         """
         Remove images older than specified days
@@ -406,18 +594,24 @@ class ImageHandler:
         Args:
             days: Age threshold in days
         """
-        import time
         threshold = time.time() - (days * 24 * 60 * 60)
 
         removed_count = 0
 
-        for directory in [self.full_dir, self.medium_dir, self.thumb_dir]:
-            for img_file in directory.glob('*.jpg'):
-                if img_file.stat().st_mtime < threshold:
-                    try:
-                        img_file.unlink()
-                        removed_count += 1
-                    except Exception as e:
-                        self.logger.error(f"Failed to remove {img_file}: {e}")
+        for key, directory in self.image_dirs.items():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.jpg') or not entry.is_file():
+                        continue
+
+                    file_stat = entry.stat()
+                    if file_stat.st_mtime < threshold:
+                        try:
+                            os.unlink(entry.path)
+                            self._stats[key] -= 1
+                            self._stats['total_bytes'] -= file_stat.st_size
+                            removed_count += 1
+                        except Exception as e:
+                            self.logger.error(f"Failed to remove {entry.path}: {e}")
 
         self.logger.info(f"Removed {removed_count} old images")
@@ -0,0 +1,127 @@
+"""
+Playwright Manager
+Renders JavaScript-heavy pages with one shared headless browser
+"""
+
+import asyncio
+import logging
+from typing import Optional, Dict
+
+from playwright.async_api import async_playwright, Browser, Playwright
+
+
+class PlaywrightManager:
+    """
+    Manages a Playwright browser shared by many page fetches
+    """
+
+    def __init__(self, config: Dict):
+        """
+        Initialize Playwright Manager
+
+        Args:
+            config: Configuration dictionary
+        """
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.playwright_config = config.get('playwright', {})
+        self._playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self.launch_failed = False
+
+    async def start(self) -> Optional[Browser]:
+        """
+        Launch the browser if it isn't running yet
+
+        Concurrent callers share one launch, and a failed launch is not retried.
+
+        Returns:
+            Running Browser instance, or None if the browser couldn't be launched
+        """
+        # Created here so the lock belongs to the running event loop
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self.browser is None and not self.launch_failed:
+                self.logger.info("Launching Playwright Chromium...")
+                try:
+                    self._playwright = await async_playwright().start()
+                    self.browser = await self._playwright.chromium.launch(
+                        headless=self.playwright_config.get('headless', True)
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to launch Playwright browser: {e}")
+                    self.launch_failed = True
+                    await self.close()
+
+        return self.browser
+
+    async def fetch_page(self, url: str, user_agent: Optional[str] = None) -> Optional[str]:
+        """
+        Render a page in a fresh browser context and return its HTML
+
+        Args:
+            url: Target URL
+            user_agent: User agent for the context (browser default if None)
+
+        Returns:
+            HTML content or None
+        """
+        browser = await self.start()
+        if browser is None:
+            return None
+
+        width, height = self.config.get('selenium', {}).get('window_size', [1920, 1080])
+        timeout = self.config.get('selenium', {}).get('page_load_timeout', 15) * 1000
+        wait_until = self.playwright_config.get('wait_until', 'networkidle')
+        scroll_delay = self.config.get('delays', {}).get('scroll_delay', 1) * 1000
+
+        # Contexts are cheap and isolate cookies/storage between sources
+        context = await browser.new_context(
+            user_agent=user_agent,
+            viewport={'width': width, 'height': height}
+        )
+
+        try:
+            page = await context.new_page()
+            await page.goto(url, wait_until=wait_until, timeout=timeout)
+
+            # Scroll once to trigger lazy-loaded content
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await page.wait_for_timeout(scroll_delay)
+
+            return await page.content()
+
+        except Exception as e:
+            self.logger.error(f"Playwright fetch failed for {url}: {e}")
+            return None
+
+        finally:
+            await context.close()
+
+    async def close(self):
+        """
+        Close the browser and stop Playwright
+        """
+        try:
+            if self.browser:
+                await self.browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+            self.logger.info("Playwright browser closed")
+        except Exception as e:
+            self.logger.error(f"Error closing Playwright: {e}")
+        finally:
+            self.browser = None
+            self._playwright = None
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
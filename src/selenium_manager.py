@@ -3,12 +3,15 @@ Selenium Manager with Advanced Anti-Detection
 Manages browser instances with stealth capabilities and fingerprint protection
 """
 
+import os
 import random
 import logging
+import threading
 import time
 from typing import Optional, List, Dict
 from pathlib import Path
 
+import urllib3
 import undetected_chromedriver as uc
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -18,11 +21,69 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 from fake_useragent import UserAgent
 
 
+# Resource URL patterns blocked through CDP when selenium.block_resources is on
+_DEFAULT_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*'
+]
+
+# Read the height and scroll to the bottom in a single round-trip. The page
+# is left at the bottom during the pause so infinite-scroll sentinels fire.
+_INFINITE_SCROLL_JS = """
+    const height = document.body.scrollHeight;
+    window.scrollTo(0, height);
+    return height;
+"""
+
+# Run every scroll_page iteration in the browser: scroll to the bottom, wait,
+# scroll back up by the next offset and wait again, calling back at the end
+_SCROLL_PAGE_JS = """
+    const [offsets, pause, done] = arguments;
+    let i = 0;
+    function step() {
+        window.scrollTo(0, document.body.scrollHeight);
+        setTimeout(() => {
+            window.scrollBy(0, -offsets[i]);
+            if (++i < offsets.length) {
+                setTimeout(step, pause / 2);
+            } else {
+                done();
+            }
+        }, pause);
+    }
+    step();
+"""
+
+# Per-thread random generators for humanizing delays and scroll offsets
+_rng = threading.local()
+
+
+def _get_rng() -> random.Random:
+    """
+    Get the calling thread's random generator, seeding it on first use
+
+    Returns:
+        Thread-local random.Random instance
+    """
+    rng = getattr(_rng, 'r', None)
+    if rng is None:
+        rng = _rng.r = random.Random(os.urandom(16))
+    return rng
+
+
 class SeleniumManager:
     """
     Manages Selenium WebDriver with advanced anti-detection features
     """
 
+    # fake_useragent data is loaded once per process and sampled up front
+    _ua: Optional[UserAgent] = None
+    _ua_pool: List[str] = []
+    _ua_lock = threading.Lock()
+    _UA_POOL_SIZE = 256
+
     def __init__(self, config: Dict):
         """
         Initialize Selenium Manager
@@ -34,7 +95,7 @@ class SeleniumManager:
         self.logger = logging.getLogger(__name__)
         self.driver: Optional[webdriver.Chrome] = None
         self.user_agents: List[str] = config.get('user_agents', [])
-        self.ua = UserAgent()
+        self._stealth_js: Optional[str] = None
 
     def _get_random_user_agent(self) -> str:
         """
@@ -43,16 +104,33 @@ class SeleniumManager:
         Returns:
             Random user agent string
         """
-        if self.user_agents and random.random() > 0.3:
-            return random.choice(self.user_agents)
+        rng = _get_rng()
+        if self.user_agents and rng.random() > 0.3:
+            return rng.choice(self.user_agents)
 
         # Fallback to fake_useragent
         try:
-            return self.ua.random
+            return rng.choice(self._get_ua_pool())
         except Exception as e:
             self.logger.warning(f"Failed to generate user agent: {e}")
             return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+    @classmethod
+    def _get_ua_pool(cls) -> List[str]:
+        """
+        Get the shared pool of sampled user agents, building it on first use
+
+        Returns:
+            List of user agent strings
+        """
+        if not cls._ua_pool:
+            with cls._ua_lock:
+                if not cls._ua_pool:
+                    if cls._ua is None:
+                        cls._ua = UserAgent()
+                    cls._ua_pool = [cls._ua.random for _ in range(cls._UA_POOL_SIZE)]
+        return cls._ua_pool
+
     def _get_chrome_options(self) -> uc.ChromeOptions:
         """
         Configure Chrome options with anti-detection settings
@@ -69,9 +147,13 @@ class SeleniumManager:
         if selenium_config.get('headless', True):
             options.add_argument('--headless=new')
 
-        # Window size
-        window_size = selenium_config.get('window_size', [1920, 1080])
-        options.add_argument(f'--window-size={window_size[0]},{window_size[1]}')
+        # Window size (random viewport if enabled, otherwise the configured size)
+        if anti_detection.get('random_viewport', True):
+            rng = _get_rng()
+            width, height = rng.randint(1366, 1920), rng.randint(768, 1080)
+        else:
+            width, height = selenium_config.get('window_size', [1920, 1080])
+        options.add_argument(f'--window-size={width},{height}')
 
         # Anti-detection arguments
         options.add_argument('--no-sandbox')
@@ -111,33 +193,28 @@ class SeleniumManager:
         # Language
         options.add_argument('--lang=en-US,en;q=0.9')
 
-        # Random viewport
-        if anti_detection.get('random_viewport', True):
-            viewport_width = random.randint(1366, 1920)
-            viewport_height = random.randint(768, 1080)
-            options.add_argument(f'--window-size={viewport_width},{viewport_height}')
-
         return options
 
-    def _apply_stealth_scripts(self):
+    def _build_stealth_js(self) -> str:
         """
-        Apply JavaScript to make the browser less detectable
+        Build the combined stealth JavaScript from the anti-detection config
+
+        Returns:
+            JavaScript source to run on every new document
         """
         anti_detection = self.config.get('anti_detection', {})
-
-        if not anti_detection.get('stealth_mode', True):
-            return
+        scripts = []
 
         # Remove webdriver flag
         if anti_detection.get('disable_webdriver_flag', True):
-            self.driver.execute_script("""
+            scripts.append("""
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined
                 });
             """)
 
         # Override permissions
-        self.driver.execute_script("""
+        scripts.append("""
             Object.defineProperty(navigator, 'permissions', {
                 get: () => ({
                     query: () => Promise.resolve({ state: 'granted' })
@@ -146,21 +223,21 @@ class SeleniumManager:
         """)
 
         # Override plugins
-        self.driver.execute_script("""
+        scripts.append("""
             Object.defineProperty(navigator, 'plugins', {
                 get: () => [1, 2, 3, 4, 5]
             });
         """)
 
         # Override languages
-        self.driver.execute_script("""
+        scripts.append("""
             Object.defineProperty(navigator, 'languages', {
                 get: () => ['en-US', 'en', 'fr']
             });
         """)
 
         # Chrome-specific overrides
-        self.driver.execute_script("""
+        scripts.append("""
             if (window.chrome) {
                 Object.defineProperty(window, 'chrome', {
                     get: () => ({
@@ -172,7 +249,7 @@ class SeleniumManager:
 
         # Canvas fingerprint protection
         if anti_detection.get('canvas_fingerprint_defense', True):
-            self.driver.execute_script("""
+            scripts.append("""
                 const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
                 HTMLCanvasElement.prototype.toDataURL = function(type) {
                     if (type === 'image/png' && this.width === 16 && this.height === 16) {
@@ -188,8 +265,54 @@ class SeleniumManager:
                 };
             """)
 
+        # One scope for the whole blob keeps helpers like originalToDataURL
+        # off the page's globals; a failing snippet doesn't skip the others
+        body = '\n'.join(f"try {{{script}}} catch (e) {{}}" for script in scripts)
+        return f"(() => {{\n{body}\n}})();"
+
+    def _apply_stealth_scripts(self):
+        """
+        Register JavaScript that makes the browser less detectable
+
+        The scripts are registered once through CDP so Chrome runs them on
+        every new document, instead of being re-injected after navigation.
+        """
+        anti_detection = self.config.get('anti_detection', {})
+
+        if not anti_detection.get('stealth_mode', True):
+            return
+
+        if self._stealth_js is None:
+            self._stealth_js = self._build_stealth_js()
+
+        self.driver.execute_cdp_cmd(
+            'Page.addScriptToEvaluateOnNewDocument',
+            {'source': self._stealth_js}
+        )
+
         self.logger.debug("Stealth scripts applied successfully")
 
+    def _apply_network_blocks(self):
+        """
+        Block images, fonts, media and trackers at the network level
+
+        Event data is read from the DOM, so these resources are never needed;
+        <img> src attributes remain available even when the download is blocked.
+        """
+        selenium_config = self.config.get('selenium', {})
+
+        if not selenium_config.get('block_resources', True):
+            return
+
+        patterns = selenium_config.get('blocked_url_patterns', _DEFAULT_BLOCKED_URL_PATTERNS)
+
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            self.logger.debug(f"Blocking {len(patterns)} resource URL patterns")
+        except Exception as e:
+            self.logger.warning(f"Failed to apply network blocks: {e}")
+
     def create_driver(self) -> webdriver.Chrome:
         """
         Create and configure a new WebDriver instance
@@ -209,17 +332,25 @@ class SeleniumManager:
                 use_subprocess=True
             )
 
+            # Allow concurrent commands on the driver connection
+            self._resize_command_pool()
+
             # Set timeouts
             selenium_config = self.config.get('selenium', {})
             page_load_timeout = selenium_config.get('page_load_timeout', 15)
-            implicit_wait = selenium_config.get('implicit_wait', 10)
 
             self.driver.set_page_load_timeout(page_load_timeout)
-            self.driver.implicitly_wait(implicit_wait)
+
+            # No implicit wait: it makes every missing-element lookup block for
+            # the full timeout. Waiting is done explicitly via wait_for_element.
+            self.driver.implicitly_wait(0)
 
             # Apply stealth scripts
             self._apply_stealth_scripts()
 
+            # Skip downloading resources that aren't needed for scraping
+            self._apply_network_blocks()
+
             self.logger.info("WebDriver created successfully")
             return self.driver
 
@@ -227,6 +358,32 @@ class SeleniumManager:
             self.logger.error(f"Failed to create WebDriver: {e}")
             raise
 
+    def _resize_command_pool(self):
+        """
+        Replace the chromedriver HTTP connection pool with a larger one
+
+        Selenium's default pool keeps a single connection, so commands issued
+        from several threads queue behind each other.
+        """
+        pool_maxsize = self.config.get('selenium', {}).get('pool_maxsize', 16)
+        executor = self.driver.command_executor
+
+        try:
+            old_pool = executor._conn
+            if getattr(old_pool, 'connection_pool_kw', {}).get('maxsize') == pool_maxsize:
+                return
+
+            # Close the old pool's sockets to chromedriver before replacing it
+            old_pool.clear()
+            executor._conn = urllib3.PoolManager(
+                maxsize=pool_maxsize,
+                block=False,
+                timeout=executor.get_timeout()
+            )
+            self.logger.debug(f"WebDriver connection pool size set to {pool_maxsize}")
+        except Exception as e:
+            self.logger.warning(f"Failed to resize WebDriver connection pool: {e}")
+
     def get_driver(self) -> webdriver.Chrome:
         """
         Get existing driver or create new one
@@ -249,20 +406,28 @@ class SeleniumManager:
         Returns:
             True if successful, False otherwise
         """
-        driver = self.get_driver()
-
         for attempt in range(retries):
+            # Re-read each attempt: recreate_driver may have replaced it
+            driver = self.get_driver()
+
             try:
                 self.logger.info(f"Navigating to {url} (attempt {attempt + 1}/{retries})")
                 driver.get(url)
 
-                # Random delay to appear human-like
-                delay_config = self.config.get('delays', {})
-                delay = random.uniform(
-                    delay_config.get('min_delay_between_pages', 2),
-                    delay_config.get('max_delay_between_pages', 5)
+                # Wait until the document is ready rather than sleeping blindly
+                page_load_timeout = self.config.get('selenium', {}).get('page_load_timeout', 15)
+                WebDriverWait(driver, page_load_timeout).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
                 )
-                time.sleep(delay)
+
+                # Small random delay to appear human-like
+                if self.config.get('anti_detection', {}).get('human_like', True):
+                    delay_config = self.config.get('delays', {})
+                    delay = _get_rng().uniform(
+                        delay_config.get('min_delay_between_pages', 0.2),
+                        delay_config.get('max_delay_between_pages', 0.8)
+                    )
+                    time.sleep(delay)
 
                 return True
 
@@ -313,15 +478,15 @@ class SeleniumManager:
             pause_time: Time to wait between scrolls
             num_scrolls: Number of scroll iterations
         """
-        for i in range(num_scrolls):
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(pause_time)
+        if num_scrolls <= 0:
+            return
 
-            # Scroll to random position
-            scroll_position = random.randint(100, 500)
-            self.driver.execute_script(f"window.scrollBy(0, -{scroll_position});")
-            time.sleep(pause_time * 0.5)
+        # One async script performs the whole sequence instead of two
+        # round-trips per scroll
+        rng = _get_rng()
+        offsets = [rng.randint(100, 500) for _ in range(num_scrolls)]
+        self.driver.set_script_timeout(max(num_scrolls * pause_time * 3, 10))
+        self.driver.execute_async_script(_SCROLL_PAGE_JS, offsets, int(pause_time * 1000))
 
     def infinite_scroll(
         self,
@@ -338,29 +503,31 @@ class SeleniumManager:
         Returns:
             Number of scrolls performed
         """
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        rng = _get_rng()
+        last_height = None
         scrolls = 0
 
-        for i in range(max_scrolls):
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(pause_time)
-
-            # Calculate new height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
+        # Each call reports the height reached after the previous pause and
+        # scrolls again, so one round-trip per iteration covers both steps
+        for i in range(max_scrolls + 1):
+            new_height = self.driver.execute_script(_INFINITE_SCROLL_JS)
 
             if new_height == last_height:
                 self.logger.info(f"Reached end of scrollable content after {scrolls} scrolls")
                 break
 
+            if last_height is not None:
+                scrolls += 1
             last_height = new_height
-            scrolls += 1
 
-            # Random small scroll up to simulate human behavior
-            if random.random() > 0.7:
-                scroll_up = random.randint(100, 300)
-                self.driver.execute_script(f"window.scrollBy(0, -{scroll_up});")
-                time.sleep(0.5)
+            if i < max_scrolls:
+                time.sleep(pause_time)
+
+                # Random small scroll up to simulate human behavior, as its own
+                # call with a pause so it renders before scrolling down again
+                if rng.random() > 0.7:
+                    self.driver.execute_script("window.scrollBy(0, -arguments[0]);", rng.randint(100, 300))
+                    time.sleep(0.5)
 
         return scrolls
 
@@ -379,7 +546,7 @@ class SeleniumManager:
         if max_delay is None:
             max_delay = delay_config.get('max_delay_between_requests', 10)
 
-        delay = random.uniform(min_delay, max_delay)
+        delay = _get_rng().uniform(min_delay, max_delay)
         self.logger.debug(f"Sleeping for {delay:.2f} seconds")
         time.sleep(delay)
 
@@ -412,12 +579,40 @@ class SeleniumManager:
 
     def recreate_driver(self):
         """
-        Close and recreate driver instance
+        Recover the driver, relaunching the browser only if its session is gone
         """
+        if self._reconnect():
+            return
+
         self.close()
         time.sleep(2)
         self.create_driver()
 
+    def _reconnect(self) -> bool:
+        """
+        Reattach to the running browser session over fresh connections
+
+        Transient errors (dropped connection to chromedriver, a hung
+        command) leave the browser and its session alive, so opening new
+        connections and checking the session responds is enough.
+
+        Returns:
+            True if the existing session is usable, False otherwise
+        """
+        if not self.driver:
+            return False
+
+        session_id = self.driver.session_id
+
+        try:
+            self._resize_command_pool()
+            self.driver.current_url
+            self.logger.info(f"Reconnected to existing WebDriver session {session_id}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not reconnect to WebDriver session {session_id}: {e}")
+            return False
+
     def close(self):
         """
         Close the browser and clean up
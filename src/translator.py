@@ -4,7 +4,12 @@ Automatic translation from Greek/English to French using deep-translator
 """
 
 import logging
-from typing import Dict, List, Optional
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 import time
 
 from deep_translator import GoogleTranslator, MyMemoryTranslator
@@ -15,6 +20,182 @@ from langdetect.lang_detect_exception import LangDetectException
 # Set seed for consistent language detection
 DetectorFactory.seed = 0
 
+# Greek and Coptic + Greek Extended blocks, and basic Latin letters
+_GREEK_CHARS = re.compile(r'[\u0370-\u03FF\u1F00-\u1FFF]')
+_LATIN_CHARS = re.compile(r'[A-Za-z]')
+
+# Strings shorter than this are classified by script alone
+_SHORT_TEXT_LENGTH = 32
+
+# Script ratios are measured on this many leading characters
+_SCRIPT_SAMPLE_LENGTH = 500
+
+# Event fields holding lists of strings; every other field holds a string
+_LIST_FIELDS = frozenset({'tags', 'gallery_urls'})
+
+# Google Translate rejects requests longer than 5000 characters
+_MAX_REQUEST_CHARS = 4500
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter shared by translation workers
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize Token Bucket
+
+        Args:
+            rate: Tokens added per second (<= 0 disables throttling)
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        # A bucket that can't hold a whole token would never hand one out
+        self.capacity = max(capacity, 1)
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a token is available, then consume it
+        """
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class TranslationCache:
+    """
+    Persistent translation cache backed by SQLite
+
+    Entries are keyed by (source language, target language, text) so repeat
+    runs can skip the translation API entirely. Writes are buffered and
+    flushed in batches with executemany.
+    """
+
+    def __init__(self, db_path: str, flush_size: int = 100):
+        """
+        Initialize Translation Cache
+
+        Args:
+            db_path: Path to the SQLite database file
+            flush_size: Number of buffered writes that triggers a flush
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.flush_size = flush_size
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str, str], str] = {}
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tr ("
+            "src TEXT, tgt TEXT, text TEXT, result TEXT, "
+            "PRIMARY KEY (src, tgt, text))"
+        )
+        self._conn.commit()
+
+    def get(self, text: str, src: str, tgt: str) -> Optional[str]:
+        """
+        Look up a cached translation
+
+        Args:
+            text: Original text
+            src: Source language code
+            tgt: Target language code
+
+        Returns:
+            Cached translation or None
+        """
+        key = (src, tgt, text)
+
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+
+            row = self._conn.execute(
+                "SELECT result FROM tr WHERE src = ? AND tgt = ? AND text = ?",
+                key
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def set(self, text: str, src: str, tgt: str, result: str):
+        """
+        Store a translation (buffered until the next flush)
+
+        Args:
+            text: Original text
+            src: Source language code
+            tgt: Target language code
+            result: Translated text
+        """
+        with self._lock:
+            self._pending[(src, tgt, text)] = result
+            if len(self._pending) >= self.flush_size:
+                self._flush_locked()
+
+    def flush(self):
+        """
+        Write buffered translations to the database
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """
+        Write buffered translations (caller holds the lock)
+        """
+        if not self._pending:
+            return
+
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO tr (src, tgt, text, result) VALUES (?, ?, ?, ?)",
+            [(src, tgt, text, result) for (src, tgt, text), result in self._pending.items()]
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def clear(self):
+        """
+        Remove all cached translations
+        """
+        with self._lock:
+            self._pending.clear()
+            self._conn.execute("DELETE FROM tr")
+            self._conn.commit()
+
+    def close(self):
+        """
+        Flush pending writes and close the database
+        """
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Number of cached translations"""
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute("SELECT COUNT(*) FROM tr").fetchone()[0]
+
 
 class Translator:
     """
@@ -36,11 +217,10 @@ class Translator:
         self.target_lang = self.translation_config.get('target_language', 'fr')
         self.source_langs = self.translation_config.get('source_languages', ['el', 'en'])
 
-        # Primary translator
-        self.translator = GoogleTranslator(target=self.target_lang)
-
-        # Fallback translator
-        self.fallback_translator = MyMemoryTranslator(target=self.target_lang)
+        # Translator instances, reused per (translator, source, target). They
+        # are kept per thread because deep-translator instances store the
+        # request parameters on themselves and are not safe to share.
+        self._local = threading.local()
 
         # Fields to translate
         self.fields_to_translate = self.translation_config.get('fields_to_translate', [
@@ -49,8 +229,23 @@ class Translator:
             'organizer_name', 'category', 'tags'
         ])
 
-        # Cache for translations
-        self.translation_cache = {}
+        # Split fields by their expected kind once instead of type-checking
+        # each one per event
+        self._str_fields = [f for f in self.fields_to_translate if f not in _LIST_FIELDS]
+        self._list_fields = [f for f in self.fields_to_translate if f in _LIST_FIELDS]
+
+        # Persistent cache for translations
+        cache_file = self.translation_config.get('cache_file', 'data/cache/translation_cache.db')
+        self.translation_cache = TranslationCache(cache_file)
+
+        # Translation is network-bound: run requests concurrently, with a
+        # shared rate limit instead of a fixed sleep after every call
+        concurrency = self.translation_config.get('concurrency', 8)
+        self._text_executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='translate')
+        self._bucket = TokenBucket(
+            rate=self.translation_config.get('qps', 10),
+            capacity=self.translation_config.get('burst', 20)
+        )
 
         self.logger.info(f"Translator initialized (target: {self.target_lang})")
 
@@ -67,6 +262,11 @@ class Translator:
         if not text or len(text.strip()) < 3:
             return None
 
+        # Cheap script-based check first, langdetect only when inconclusive
+        lang = self._fast_lang(text)
+        if lang:
+            return lang
+
         try:
             lang = detect(text)
             self.logger.debug(f"Detected language: {lang} for text: {text[:50]}...")
@@ -75,6 +275,30 @@ class Translator:
             self.logger.debug(f"Language detection failed: {e}")
             return None
 
+    def _fast_lang(self, text: str) -> Optional[str]:
+        """
+        Classify text by character script without running langdetect
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            'el' for Greek text, 'en' for short Latin-script text, None if unsure
+        """
+        # A bounded prefix keeps this cheaper than langdetect on long descriptions
+        sample = text[:_SCRIPT_SAMPLE_LENGTH]
+        non_whitespace = len(''.join(sample.split()))
+        if not non_whitespace:
+            return None
+
+        if len(_GREEK_CHARS.findall(sample)) > 0.1 * non_whitespace:
+            return 'el'
+
+        if len(text) < _SHORT_TEXT_LENGTH and len(_LATIN_CHARS.findall(sample)) > 0.5 * non_whitespace:
+            return 'en'
+
+        return None
+
     def should_translate(self, text: str, detected_lang: Optional[str] = None) -> bool:
         """
         Determine if text should be translated
@@ -125,10 +349,13 @@ class Translator:
         if len(text) < 2:
             return text
 
-        # Check cache
-        if use_cache and text in self.translation_cache:
-            self.logger.debug(f"Using cached translation for: {text[:30]}...")
-            return self.translation_cache[text]
+        # Check cache (keyed on the language as given, 'auto' when unknown)
+        cache_lang = source_lang or 'auto'
+        if use_cache:
+            cached = self.translation_cache.get(text, cache_lang, self.target_lang)
+            if cached is not None:
+                self.logger.debug(f"Using cached translation for: {text[:30]}...")
+                return cached
 
         # Auto-detect language if needed
         if source_lang is None and self.translation_config.get('auto_detect_language', True):
@@ -142,18 +369,15 @@ class Translator:
             # Translate
             self.logger.debug(f"Translating ({source_lang} -> {self.target_lang}): {text[:50]}...")
 
-            # Update translator source language
-            if source_lang and source_lang != 'auto':
-                self.translator = GoogleTranslator(source=source_lang, target=self.target_lang)
+            translator = self._get_translator(GoogleTranslator, source_lang)
 
-            translated = self.translator.translate(text)
+            # Shared rate limit to avoid provider throttling
+            self._bucket.acquire()
+            translated = translator.translate(text)
 
             # Cache translation
             if use_cache and translated:
-                self.translation_cache[text] = translated
-
-            # Small delay to avoid rate limiting
-            time.sleep(0.1)
+                self.translation_cache.set(text, cache_lang, self.target_lang, translated)
 
             return translated
 
@@ -163,18 +387,12 @@ class Translator:
             # Try fallback translator
             try:
                 self.logger.debug("Trying fallback translator...")
-                if source_lang and source_lang != 'auto':
-                    self.fallback_translator = MyMemoryTranslator(
-                        source=source_lang,
-                        target=self.target_lang
-                    )
-
-                translated = self.fallback_translator.translate(text)
+                fallback_translator = self._get_translator(MyMemoryTranslator, source_lang)
+                self._bucket.acquire()
+                translated = fallback_translator.translate(text)
 
                 if use_cache and translated:
-                    self.translation_cache[text] = translated
-
-                time.sleep(0.2)
+                    self.translation_cache.set(text, cache_lang, self.target_lang, translated)
 
                 return translated
 
@@ -182,96 +400,454 @@ class Translator:
                 self.logger.error(f"Fallback translation failed: {e2}")
                 return None
 
-    def translate_event(self, event: Dict) -> Dict:
+    def translate_texts(
+        self,
+        texts: List[str],
+        source_lang: Optional[str] = None
+    ) -> List[Optional[str]]:
         """
-        Translate all translatable fields in an event
+        Translate several short strings with as few requests as possible
+
+        Cached strings are answered from the cache; the others are joined
+        with newlines and sent as one request per source language, falling
+        back to one request per string when the response doesn't split back
+        into the same number of lines.
 
         Args:
-            event: Event dictionary
+            texts: List of texts to translate
+            source_lang: Source language (auto-detect each text if None)
 
         Returns:
-            Event with translated fields added (original + _fr versions)
+            Translations aligned with texts (None where translation failed)
         """
-        if not self.translation_config.get('enabled', True):
-            return event
-
-        translated_event = event.copy()
+        results: List[Optional[str]] = [None] * len(texts)
+        cache_lang = source_lang or 'auto'
+        auto_detect = self.translation_config.get('auto_detect_language', True)
+        pending: Dict[Optional[str], List[int]] = {}
 
-        # Detect primary language from title
-        title = event.get('title', '')
-        detected_lang = self.detect_language(title) if title else None
+        for index, text in enumerate(texts):
+            if not text or not isinstance(text, str):
+                continue
 
-        # Translate each field
-        for field in self.fields_to_translate:
-            original_value = event.get(field)
+            text = text.strip()
+            if len(text) < 2:
+                results[index] = text
+                continue
 
-            if not original_value:
+            cached = self.translation_cache.get(text, cache_lang, self.target_lang)
+            if cached is not None:
+                results[index] = cached
                 continue
 
-            # Handle different value types
-            if isinstance(original_value, str):
-                translated_value = self.translate_text(
-                    original_value,
-                    source_lang=detected_lang
-                )
-
-                if translated_value and translated_value != original_value:
-                    # Add translated field
-                    translated_field_name = f"{field}_fr"
-                    translated_event[translated_field_name] = translated_value
-                    self.logger.debug(f"Translated {field}: {original_value[:30]} -> {translated_value[:30]}")
-                else:
-                    # No translation or same as original
-                    translated_event[f"{field}_fr"] = original_value
+            lang = source_lang
+            if lang is None and auto_detect:
+                lang = self.detect_language(text)
+                if not self.should_translate(text, lang):
+                    results[index] = text
+                    continue
 
-            elif isinstance(original_value, list):
-                # Handle lists (e.g., tags)
-                translated_list = []
-                for item in original_value:
-                    if isinstance(item, str):
-                        translated_item = self.translate_text(item, source_lang=detected_lang)
-                        translated_list.append(translated_item if translated_item else item)
-                    else:
-                        translated_list.append(item)
+            pending.setdefault(lang, []).append(index)
 
-                translated_event[f"{field}_fr"] = translated_list
+        for lang, indices in pending.items():
+            for chunk in self._chunk_for_request(texts, indices):
+                self._translate_chunk(texts, chunk, lang, cache_lang, results)
 
-        return translated_event
+        return results
+
+    def _chunk_for_request(self, texts: List[str], indices: List[int]) -> List[List[int]]:
+        """
+        Split text indices into chunks that fit in one translation request
+
+        Args:
+            texts: Texts being translated
+            indices: Indices of the texts to send
+
+        Returns:
+            List of index chunks
+        """
+        chunks = []
+        chunk = []
+        length = 0
+
+        for index in indices:
+            size = len(texts[index].strip()) + 1
+            if chunk and length + size > _MAX_REQUEST_CHARS:
+                chunks.append(chunk)
+                chunk = []
+                length = 0
+            chunk.append(index)
+            length += size
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def _translate_chunk(
+        self,
+        texts: List[str],
+        chunk: List[int],
+        source_lang: Optional[str],
+        cache_lang: str,
+        results: List[Optional[str]]
+    ):
+        """
+        Translate a chunk of texts in a single request, storing into results
+
+        Args:
+            texts: Texts being translated
+            chunk: Indices of the texts in this chunk
+            source_lang: Source language of the chunk
+            cache_lang: Language the translations are cached under
+            results: Result list to fill in
+        """
+        lines = [texts[index].strip() for index in chunk]
+
+        if len(lines) > 1 and not any('\n' in line for line in lines):
+            try:
+                translator = self._get_translator(GoogleTranslator, source_lang)
+                self._bucket.acquire()
+                translated = translator.translate('\n'.join(lines))
+                parts = translated.split('\n') if translated else []
+
+                if len(parts) == len(lines):
+                    for index, line, part in zip(chunk, lines, parts):
+                        part = part.strip()
+                        results[index] = part
+                        if part:
+                            self.translation_cache.set(line, cache_lang, self.target_lang, part)
+                    return
+
+                self.logger.debug(f"Batched translation returned {len(parts)} lines for {len(lines)}, retrying one by one")
+
+            except Exception as e:
+                self.logger.warning(f"Batched translation failed: {e}")
+
+        for index, line in zip(chunk, lines):
+            results[index] = self._translate_key((line, source_lang))
+            if results[index] and cache_lang != (source_lang or 'auto'):
+                self.translation_cache.set(line, cache_lang, self.target_lang, results[index])
+
+    def _get_translator(self, translator_class: type, source_lang: Optional[str]):
+        """
+        Get a reusable translator instance for the current thread
+
+        Args:
+            translator_class: GoogleTranslator or MyMemoryTranslator
+            source_lang: Source language ('auto' if None)
+
+        Returns:
+            Translator instance for source_lang -> target language
+        """
+        translators = getattr(self._local, 'translators', None)
+        if translators is None:
+            translators = self._local.translators = {}
+
+        key = (translator_class, source_lang or 'auto', self.target_lang)
+        translator = translators.get(key)
+        if translator is None:
+            translator = translators[key] = translator_class(source=key[1], target=key[2])
+
+        return translator
+
+    def translate_event(self, event: Dict) -> Dict:
+        """
+        Translate all translatable fields in an event
+
+        Args:
+            event: Event dictionary
+
+        Returns:
+            Event with translated fields added (original + _fr versions)
+        """
+        if not self.translation_config.get('enabled', True):
+            return event
+
+        detected_lang = self._detect_event_language(event)
+        values, items = self._collect_texts(event)
+        translations = self._translate_unique(
+            dict.fromkeys((text, detected_lang) for text in values),
+            dict.fromkeys((item, detected_lang) for item in items)
+        )
+
+        return self._apply_translations(event, detected_lang, translations)
 
     def translate_batch(self, events: List[Dict]) -> List[Dict]:
         """
         Translate multiple events
 
+        Strings shared between events (categories, cities, venues, tags...)
+        are translated only once for the whole batch.
+
         Args:
             events: List of event dictionaries
 
         Returns:
             List of events with translations
         """
-        translated_events = []
-
-        batch_size = self.translation_config.get('batch_size', 10)
+        if not self.translation_config.get('enabled', True):
+            return list(events)
 
-        for i, event in enumerate(events):
+        # Detect each event's language and collect unique strings
+        languages = []
+        keys = {}
+        item_keys = {}
+        for event in events:
             try:
-                self.logger.info(f"Translating event {i+1}/{len(events)}: {event.get('title', 'Unknown')[:50]}")
-                translated_event = self.translate_event(event)
-                translated_events.append(translated_event)
+                detected_lang = self._detect_event_language(event)
+                values, items = self._collect_texts(event)
+                keys.update(dict.fromkeys((text, detected_lang) for text in values))
+                item_keys.update(dict.fromkeys((item, detected_lang) for item in items))
+            except Exception as e:
+                self.logger.error(f"Failed to prepare event for translation: {e}")
+                detected_lang = None
+            languages.append(detected_lang)
 
-                # Pause between batches to avoid rate limiting
-                if (i + 1) % batch_size == 0:
-                    self.logger.debug(f"Processed batch of {batch_size}, pausing...")
-                    time.sleep(1)
+        item_keys = {key: None for key in item_keys if key not in keys}
+        self.logger.info(f"Translating {len(keys) + len(item_keys)} unique strings for {len(events)} events")
+        translations = self._translate_unique(keys, item_keys)
 
+        # Fan translations back out to the events
+        translated_events = []
+        for event, detected_lang in zip(events, languages):
+            try:
+                translated_events.append(self._apply_translations(event, detected_lang, translations))
             except Exception as e:
                 self.logger.error(f"Failed to translate event: {e}")
                 # Add original event even if translation fails
                 translated_events.append(event)
 
+        self.translation_cache.flush()
+
         self.logger.info(f"Translation complete: {len(translated_events)} events processed")
 
         return translated_events
 
+    def _detect_event_language(self, event: Dict) -> Optional[str]:
+        """
+        Detect the primary language of an event
+
+        Args:
+            event: Event dictionary
+
+        Returns:
+            ISO 639-1 language code or None
+        """
+        # Detect once from the leading fields; every string of the event is
+        # then translated from that language without re-detection
+        description = event.get('description')
+        parts = [
+            event.get('title'),
+            event.get('subtitle'),
+            description[:200] if isinstance(description, str) else None
+        ]
+        sample = " ".join(part for part in parts if isinstance(part, str) and part)
+        return self.detect_language(sample) if sample else None
+
+    def _collect_texts(self, event: Dict) -> Tuple[List[str], List[str]]:
+        """
+        Collect the unique strings of an event that need translating
+
+        Args:
+            event: Event dictionary
+
+        Returns:
+            Tuple of (field values, list items not already in the field
+            values), each deduplicated in order
+        """
+        values = []
+        items = []
+        for field in self._str_fields:
+            original_value = event.get(field)
+
+            if type(original_value) is str:
+                values.append(original_value)
+            elif isinstance(original_value, list):
+                items.extend(item for item in original_value if isinstance(item, str))
+
+        for field in self._list_fields:
+            original_value = event.get(field)
+
+            if type(original_value) is list:
+                items.extend(item for item in original_value if type(item) is str)
+            elif isinstance(original_value, str):
+                values.append(original_value)
+
+        values = list(dict.fromkeys(text for text in values if text))
+        seen = set(values)
+        items = [item for item in dict.fromkeys(item for item in items if item) if item not in seen]
+
+        return values, items
+
+    def _translate_unique(
+        self,
+        keys: Iterable[Tuple[str, Optional[str]]],
+        item_keys: Iterable[Tuple[str, Optional[str]]] = ()
+    ) -> Dict[Tuple[str, Optional[str]], Optional[str]]:
+        """
+        Translate unique (text, source language) pairs
+
+        Field values are translated concurrently, one request each; list
+        items (tags, categories...) are short, so they are batched into as
+        few requests as possible per source language while the field
+        values are in flight.
+
+        Args:
+            keys: Unique (text, source language) pairs of field values
+            item_keys: Unique (text, source language) pairs of list items
+
+        Returns:
+            Dictionary mapping each pair to its translation
+        """
+        keys = list(keys)
+        results = self._text_executor.map(self._translate_key, keys)
+
+        items_by_lang: Dict[Optional[str], List[str]] = {}
+        for item, source_lang in item_keys:
+            items_by_lang.setdefault(source_lang, []).append(item)
+
+        translations = {}
+        for source_lang, items in items_by_lang.items():
+            translated = self._translate_items(items, source_lang)
+            translations.update(((item, source_lang), result) for item, result in zip(items, translated))
+
+        translations.update(zip(keys, results))
+        return translations
+
+    def _translate_items(self, items: List[str], source_lang: Optional[str]) -> List[Optional[str]]:
+        """
+        Batch-translate list items, logging failures
+
+        Args:
+            items: List items sharing a source language
+            source_lang: Source language
+
+        Returns:
+            Translations aligned with items
+        """
+        try:
+            return self.translate_texts(items, source_lang=source_lang)
+        except Exception as e:
+            self.logger.error(f"Failed to translate {len(items)} list items: {e}")
+            return [None] * len(items)
+
+    def _translate_key(self, key: Tuple[str, Optional[str]]) -> Optional[str]:
+        """
+        Translate one (text, source language) pair, logging failures
+
+        Args:
+            key: (text, source language) pair
+
+        Returns:
+            Translated text or None
+        """
+        text, source_lang = key
+        try:
+            return self.translate_text(text, source_lang=source_lang)
+        except Exception as e:
+            self.logger.error(f"Failed to translate '{text[:30]}': {e}")
+            return None
+
+    def _apply_translations(
+        self,
+        event: Dict,
+        detected_lang: Optional[str],
+        translations: Dict[Tuple[str, Optional[str]], Optional[str]]
+    ) -> Dict:
+        """
+        Build the translated event from precomputed translations
+
+        Args:
+            event: Event dictionary
+            detected_lang: Language the event's strings were translated from
+            translations: Mapping of (text, source language) to translation
+
+        Returns:
+            Event with translated fields added (original + _fr versions)
+        """
+        translated_event = event.copy()
+
+        # Add translated fields
+        for field in self._str_fields:
+            original_value = event.get(field)
+
+            if not original_value:
+                continue
+
+            if type(original_value) is str:
+                self._apply_string(translated_event, field, original_value, detected_lang, translations)
+            elif isinstance(original_value, list):
+                self._apply_list(translated_event, field, original_value, detected_lang, translations)
+
+        for field in self._list_fields:
+            original_value = event.get(field)
+
+            if not original_value:
+                continue
+
+            if type(original_value) is list:
+                self._apply_list(translated_event, field, original_value, detected_lang, translations)
+            elif isinstance(original_value, str):
+                self._apply_string(translated_event, field, original_value, detected_lang, translations)
+
+        return translated_event
+
+    def _apply_string(
+        self,
+        translated_event: Dict,
+        field: str,
+        original_value: str,
+        detected_lang: Optional[str],
+        translations: Dict[Tuple[str, Optional[str]], Optional[str]]
+    ):
+        """
+        Set the translated version of a string field
+
+        Args:
+            translated_event: Event being built
+            field: Field name
+            original_value: Original field value
+            detected_lang: Language the event's strings were translated from
+            translations: Mapping of (text, source language) to translation
+        """
+        translated_value = translations.get((original_value, detected_lang))
+
+        if translated_value and translated_value != original_value:
+            # Add translated field
+            translated_event[f"{field}_fr"] = translated_value
+            self.logger.debug(f"Translated {field}: {original_value[:30]} -> {translated_value[:30]}")
+        else:
+            # No translation or same as original
+            translated_event[f"{field}_fr"] = original_value
+
+    def _apply_list(
+        self,
+        translated_event: Dict,
+        field: str,
+        original_value: List,
+        detected_lang: Optional[str],
+        translations: Dict[Tuple[str, Optional[str]], Optional[str]]
+    ):
+        """
+        Set the translated version of a list field (e.g., tags)
+
+        Args:
+            translated_event: Event being built
+            field: Field name
+            original_value: Original list
+            detected_lang: Language the event's strings were translated from
+            translations: Mapping of (text, source language) to translation
+        """
+        translated_list = []
+        for item in original_value:
+            if isinstance(item, str):
+                translated_item = translations.get((item, detected_lang))
+                translated_list.append(translated_item if translated_item else item)
+            else:
+                translated_list.append(item)
+
+        translated_event[f"{field}_fr"] = translated_list
+
     def get_translation_stats(self) -> Dict:
         """
         Get translation statistics
@@ -293,6 +869,13 @@ class Translator:
         self.translation_cache.clear()
         self.logger.info("Translation cache cleared")
 
+    def close(self):
+        """
+        Stop translation workers and close the translation cache
+        """
+        self._text_executor.shutdown(wait=True)
+        self.translation_cache.close()
+
     def set_target_language(self, lang_code: str):
         """
         Change target language
@@ -301,8 +884,6 @@ class Translator:
             lang_code: ISO 639-1 language code
         """
         self.target_lang = lang_code
-        self.translator = GoogleTranslator(target=lang_code)
-        self.fallback_translator = MyMemoryTranslator(target=lang_code)
         self.logger.info(f"Target language changed to: {lang_code}")
 
     def translate_list_to_string(self, items: List[str], separator: str = ", ") -> str:
@@ -319,11 +900,7 @@ class Translator:
         if not items:
             return ""
 
-        translated_items = []
-        for item in items:
-            translated = self.translate_text(item)
-            if translated:
-                translated_items.append(translated)
+        translated_items = [translated for translated in self.translate_texts(items) if translated]
 
         return separator.join(translated_items)
 
@@ -342,13 +919,6 @@ class Translator:
         Returns:
             List of translated texts
         """
-        translated = []
-
-        for text in texts:
-            if text:
-                result = self.translate_text(text, source_lang=source_lang)
-                translated.append(result if result else text)
-            else:
-                translated.append(text)
+        results = self.translate_texts(texts, source_lang=source_lang)
 
-        return translated
+        return [result if text and result else text for text, result in zip(texts, results)]
@@ -3,18 +3,143 @@ Web Scraper for Event Websites
 Intelligent scraper that uses both requests and Selenium based on site requirements
 """
 
+import asyncio
+import functools
 import logging
+import random
 import requests
+import threading
 import time
 import re
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import validators
 
 from .selenium_manager import SeleniumManager
+from .cache_manager import CacheManager
+
+if TYPE_CHECKING:
+    # Playwright is optional; it's imported when a browser batch needs it
+    from .playwright_manager import PlaywrightManager
+
+
+# Common event containers: by class name, data-type or Schema.org itemtype
+_CONTAINER_SELECTOR = (
+    ':is(div, article, li):is('
+    '[class*="event" i], [class*="listing" i], [data-type="event"], [itemtype*="Event"])'
+)
+
+# Case-insensitive class-name keywords for container fields, one named group
+# per field so a single scan reports every field a class string hints at
+_FIELD_CLASS_RE = re.compile(
+    r'(?P<title>title)|(?P<date>date)|(?P<description>description|excerpt|summary)|(?P<venue>venue|location)',
+    re.I
+)
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4'})
+_CONTAINER_FIELD_COUNT = 7
+
+# Open Graph tags, and a strainer building only <meta> elements
+_OG_META_SELECTOR = 'meta[property^="og:"]'
+_META_STRAINER = SoupStrainer('meta')
+
+# Fields every Schema.org event starts with
+_SCHEMA_EVENT_DEFAULTS = {
+    'title': None,
+    'description': None,
+    'start_date': None,
+    'end_date': None,
+    'venue_name': None,
+    'venue_address': None,
+    'image_url': None,
+    'event_url': None,
+    'price': None,
+    'organizer_name': None
+}
+
+# (Schema.org key, event field, transform) for the scalar event properties;
+# transform is 'date' (ISO 8601), 'url' (resolved against the page) or None
+_SCHEMA_FIELDS = (
+    ('name', 'title', None),
+    ('description', 'description', None),
+    ('startDate', 'start_date', 'date'),
+    ('endDate', 'end_date', 'date'),
+    ('url', 'event_url', 'url'),
+)
+
+# CDATA / HTML comment wrappers that lxml leaves inside JSON-LD script text
+_JSON_LD_WRAPPER_RE = re.compile(
+    r'^\s*(?://\s*)?(?:<!\[CDATA\[|<!--)|(?://\s*)?(?:\]\]>|-->)\s*$'
+)
+
+# Link targets that suggest an event page
+_EVENT_HREF_RE = re.compile(r'event|concert|show|festival|exhibition|conference', re.I)
+_MAX_PATTERN_LINKS = 500
+
+# One pooled session shared by every WebScraper so sockets are reused
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """
+    Get the process-wide requests session, creating it on first use
+
+    Returns:
+        Session with a large keep-alive pool and retries on transient errors
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+
+            _session = requests.Session()
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+
+        return _session
+
+
+# Listing pages repeat the same links and image paths under one base URL
+_join_url = functools.lru_cache(maxsize=8192)(urljoin)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """
+    Parse a date string to ISO 8601, memoized since listings repeat dates
+
+    Args:
+        date_str: Date string
+
+    Returns:
+        ISO formatted date string or None
+    """
+    # Schema.org dates are nearly always ISO 8601 already
+    try:
+        iso_str = date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str
+        return datetime.fromisoformat(iso_str).isoformat()
+    except ValueError:
+        pass
+
+    try:
+        return date_parser.parse(date_str, fuzzy=True).isoformat()
+    except Exception as e:
+        logging.getLogger(__name__).debug(f"Failed to parse date '{date_str}': {e}")
+        return None
 
 
 class WebScraper:
@@ -22,32 +147,42 @@ class WebScraper:
     Scrapes events from regular websites using intelligent extraction
     """
 
-    def __init__(self, selenium_manager: Optional[SeleniumManager], config: Dict):
+    def __init__(
+        self,
+        selenium_manager: Optional[SeleniumManager],
+        config: Dict,
+        cache_manager: Optional[CacheManager] = None
+    ):
         """
         Initialize Web Scraper
 
         Args:
             selenium_manager: SeleniumManager instance (optional)
             config: Configuration dictionary
+            cache_manager: CacheManager for conditional requests (optional)
         """
         self.selenium_manager = selenium_manager
         self.config = config
+        self.cache_manager = cache_manager
+        self.http_cache_ttl = config.get('cache', {}).get('http_cache_ttl_hours', 168) * 3600
+        self.max_page_bytes = config.get('performance', {}).get('max_page_size_mb', 10) * 1024 * 1024
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
+        self.session = _get_shared_session()
         self._setup_session()
 
     def _setup_session(self):
         """
-        Setup requests session with headers
+        Setup the request headers sent by this scraper
+
+        Headers are passed per request since the session is shared.
         """
         user_agents = self.config.get('user_agents', [])
         if user_agents:
-            import random
             user_agent = random.choice(user_agents)
         else:
             user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
-        self.session.headers.update({
+        self._headers = {
             'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -55,7 +190,7 @@ class WebScraper:
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
-        })
+        }
 
     def scrape_url(
         self,
@@ -80,56 +215,458 @@ class WebScraper:
             self.logger.info(f"Scraping {url} (selenium={use_selenium})")
 
             # Get HTML content
+            response = None
             if use_selenium:
                 html = self._fetch_with_selenium(url)
             else:
-                html = self._fetch_with_requests(url, timeout)
+                cached_page = self._get_cached_page(url)
+                response, html = self._fetch_with_requests(url, timeout, cached_page)
+
+                # Unchanged since the last fetch: skip parsing entirely
+                if response is not None and response.status_code == 304:
+                    self.logger.info(f"{url} not modified, reusing {len(cached_page['events'])} cached events")
+                    return cached_page['events']
 
             if not html:
                 self.logger.warning(f"No HTML content retrieved from {url}")
                 return events
 
-            # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Try different extraction strategies
-            events = self._extract_events(soup, url)
+            encoding = self._declared_encoding(response) if response is not None else None
+            events = self._extract_from_html(html, url, encoding)
 
-            self.logger.info(f"Found {len(events)} events from {url}")
+            if response is not None:
+                self._cache_page(url, response, events)
 
         except Exception as e:
             self.logger.error(f"Error scraping {url}: {e}")
 
         return events
 
-    def _fetch_with_requests(self, url: str, timeout: int = 15) -> Optional[str]:
+    def scrape_urls(
+        self,
+        urls: List[str],
+        use_selenium: bool = False,
+        timeout: int = 15,
+        check_health: bool = False
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape events from several URLs concurrently
+
+        Pages are fetched with a shared async HTTP client; requests to the
+        same host are still spaced by the configured delay, while different
+        hosts are fetched in parallel. With use_selenium, pages are rendered
+        with Playwright, falling back to Selenium if that fails.
+
+        Args:
+            urls: Target URLs
+            use_selenium: Render pages in a browser
+            timeout: Request timeout in seconds
+            check_health: Health-check all URLs first and skip dead ones
+
+        Returns:
+            Dictionary mapping each URL to its list of events
+        """
+        return asyncio.run(self._scrape_urls_async(urls, use_selenium, timeout, check_health))
+
+    async def _scrape_urls_async(
+        self,
+        urls: List[str],
+        use_selenium: bool,
+        timeout: int,
+        check_health: bool = False
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape URLs concurrently on the running event loop
+
+        Args:
+            urls: Target URLs
+            use_selenium: Render pages in a browser
+            timeout: Request timeout in seconds
+            check_health: Health-check all URLs first and skip dead ones
+
+        Returns:
+            Dictionary mapping each URL to its list of events
+        """
+        if check_health:
+            health_timeout = self.config.get('health_check', {}).get('timeout', 5)
+            healthy = await self.health_check_many(urls, timeout=health_timeout)
+            for url in urls:
+                if not healthy[url]:
+                    self.logger.warning(f"Health check failed for {url}")
+
+            results = await self._scrape_urls_async(
+                [url for url in urls if healthy[url]], use_selenium, timeout
+            )
+            return {url: results.get(url, []) for url in urls}
+
+        max_concurrent = self.config.get('performance', {}).get('max_concurrent_requests', 16)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        host_locks: Dict[str, asyncio.Lock] = {}
+        selenium_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+
+        # JavaScript pages render in one Playwright browser shared by the batch
+        playwright_config = self.config.get('playwright', {})
+        playwright_manager = None
+        if use_selenium and playwright_config.get('enabled', True):
+            playwright_manager = self._create_playwright_manager()
+        page_semaphore = asyncio.Semaphore(playwright_config.get('max_pages', 4))
+
+        async def scrape_one(client: httpx.AsyncClient, url: str) -> List[Dict]:
+            try:
+                self.logger.info(f"Scraping {url} (selenium={use_selenium})")
+
+                response = None
+                if use_selenium:
+                    html = None
+                    if playwright_manager:
+                        async with page_semaphore:
+                            html = await self._fetch_with_playwright(playwright_manager, url)
+
+                    if not html:
+                        # Fall back to the single Selenium browser, one page at a time
+                        async with selenium_lock:
+                            html = await loop.run_in_executor(None, self._fetch_with_selenium, url)
+                else:
+                    cached_page = self._get_cached_page(url)
+                    host_lock = host_locks.setdefault(urlparse(url).netloc, asyncio.Lock())
+                    async with host_lock:
+                        async with semaphore:
+                            response, html = await self._fetch_with_httpx(client, url, timeout, cached_page)
+
+                        # Wait out the delay for this host without holding a global slot
+                        if response is not None and response.status_code != 304:
+                            await asyncio.sleep(self._politeness_delay())
+
+                    if response is not None and response.status_code == 304:
+                        self.logger.info(f"{url} not modified, reusing {len(cached_page['events'])} cached events")
+                        return cached_page['events']
+
+                if not html:
+                    self.logger.warning(f"No HTML content retrieved from {url}")
+                    return []
+
+                encoding = self._declared_encoding(response) if response is not None else None
+                events = await loop.run_in_executor(None, self._extract_from_html, html, url, encoding)
+
+                if response is not None:
+                    self._cache_page(url, response, events)
+
+                return events
+
+            except Exception as e:
+                self.logger.error(f"Error scraping {url}: {e}")
+                return []
+
+        limits = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        try:
+            async with httpx.AsyncClient(http2=True, limits=limits, headers=self._headers) as client:
+                results = await asyncio.gather(*(scrape_one(client, url) for url in urls))
+        finally:
+            if playwright_manager:
+                await playwright_manager.close()
+
+        return dict(zip(urls, results))
+
+    def _create_playwright_manager(self) -> Optional['PlaywrightManager']:
+        """
+        Create a PlaywrightManager if Playwright is installed
+
+        Returns:
+            PlaywrightManager instance or None (pages then render with Selenium)
+        """
+        try:
+            from .playwright_manager import PlaywrightManager
+        except ImportError as e:
+            self.logger.warning(f"Playwright not available, rendering with Selenium: {e}")
+            return None
+
+        return PlaywrightManager(self.config)
+
+    def _extract_from_html(
+        self,
+        html: Union[str, bytes],
+        url: str,
+        encoding: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Parse a fetched page and extract its events
+
+        Args:
+            html: HTML content, as text or raw bytes
+            url: Page URL, used to resolve relative links
+            encoding: Encoding of raw bytes, if declared by the server
+
+        Returns:
+            List of event dictionaries
+        """
+        # Parse HTML
+        soup = self._parse_html(html, from_encoding=encoding)
+
+        # Try different extraction strategies
+        events = self._extract_events(soup, url)
+
+        self.logger.info(f"Found {len(events)} events from {url}")
+
+        return events
+
+    def _parse_html(
+        self,
+        html: Union[str, bytes],
+        parse_only: Optional[SoupStrainer] = None,
+        from_encoding: Optional[str] = None
+    ) -> BeautifulSoup:
+        """
+        Parse HTML with lxml, falling back to the pure-Python parser
+
+        Args:
+            html: HTML content, as text or raw bytes
+            parse_only: Optional strainer restricting which elements are built
+            from_encoding: Encoding of raw bytes (detected from the document if None)
+
+        Returns:
+            BeautifulSoup parsed HTML
+        """
+        options = {'parse_only': parse_only}
+        if from_encoding and isinstance(html, bytes):
+            options['from_encoding'] = from_encoding
+
+        try:
+            return BeautifulSoup(html, 'lxml', **options)
+        except Exception as e:
+            self.logger.debug(f"lxml parsing failed, falling back to html.parser: {e}")
+            return BeautifulSoup(html, 'html.parser', **options)
+
+    def _fetch_with_requests(
+        self,
+        url: str,
+        timeout: int = 15,
+        cached_page: Optional[Dict] = None
+    ) -> Tuple[Optional[requests.Response], Optional[bytes]]:
         """
         Fetch HTML using requests library
 
+        The body is streamed as raw bytes, capped at the configured page
+        size, and left undecoded so the parser can use the document's own
+        charset declaration.
+
         Args:
             url: Target URL
             timeout: Request timeout
+            cached_page: Cached page whose validators make the request conditional
 
         Returns:
-            HTML content or None
+            Tuple of (response, body); the response has status 304 and no
+            body if the cached page is still current, both are None on error
         """
+        headers = self._headers
+        if cached_page:
+            headers = {**self._headers, **cached_page['validators']}
+
         try:
-            response = self.session.get(url, timeout=timeout, allow_redirects=True)
-            response.raise_for_status()
-
-            # Random delay
-            delay_config = self.config.get('delays', {})
-            import random
-            delay = random.uniform(
-                delay_config.get('min_delay_between_requests', 3),
-                delay_config.get('max_delay_between_requests', 10)
-            )
-            time.sleep(delay)
+            response = self.session.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+
+            try:
+                # Not modified: no body was sent, so no politeness delay either
+                if cached_page and response.status_code == 304:
+                    return response, None
+
+                response.raise_for_status()
+                body = self._read_body(response, url)
+            finally:
+                # Hand the connection back to the pool
+                response.close()
+
+            time.sleep(self._politeness_delay())
 
-            return response.text
+            return response, body
 
         except requests.RequestException as e:
             self.logger.error(f"Request failed for {url}: {e}")
+            return None, None
+
+    def _politeness_delay(self) -> float:
+        """
+        Pick a random delay to wait after fetching a page
+
+        Returns:
+            Delay in seconds
+        """
+        delay_config = self.config.get('delays', {})
+        return random.uniform(
+            delay_config.get('min_delay_between_requests', 3),
+            delay_config.get('max_delay_between_requests', 10)
+        )
+
+    def _read_body(self, response: requests.Response, url: str) -> bytes:
+        """
+        Read a streamed response body, stopping at the page size limit
+
+        Args:
+            response: Streamed response
+            url: Target URL (for logging)
+
+        Returns:
+            Body bytes, truncated if the page exceeds the limit
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=16384):
+            size += len(chunk)
+            if size > self.max_page_bytes:
+                self.logger.warning(f"Page exceeds {self.max_page_bytes // (1024 * 1024)} MB, truncating: {url}")
+                break
+            chunks.append(chunk)
+
+        return b''.join(chunks)
+
+    async def _read_body_async(self, response: httpx.Response, url: str) -> bytes:
+        """
+        Read a streamed async response body, stopping at the page size limit
+
+        Args:
+            response: Streamed response
+            url: Target URL (for logging)
+
+        Returns:
+            Body bytes, truncated if the page exceeds the limit
+        """
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes(chunk_size=16384):
+            size += len(chunk)
+            if size > self.max_page_bytes:
+                self.logger.warning(f"Page exceeds {self.max_page_bytes // (1024 * 1024)} MB, truncating: {url}")
+                break
+            chunks.append(chunk)
+
+        return b''.join(chunks)
+
+    def _declared_encoding(self, response: Union[requests.Response, httpx.Response]) -> Optional[str]:
+        """
+        Get the charset declared in the Content-Type header, if any
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Encoding name or None
+        """
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            return response.encoding
+        return None
+
+    def _get_cached_page(self, url: str) -> Optional[Dict]:
+        """
+        Get the cached validators and events of a previously fetched page
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Dictionary with 'validators' and 'events', or None
+        """
+        if not self.cache_manager:
+            return None
+
+        cached_page = self.cache_manager.get_cached_url_response(url)
+        if isinstance(cached_page, dict) and cached_page.get('validators'):
+            return cached_page
+
+        return None
+
+    def _cache_page(
+        self,
+        url: str,
+        response: Union[requests.Response, httpx.Response],
+        events: List[Dict]
+    ):
+        """
+        Cache a page's ETag/Last-Modified validators along with its events
+
+        Args:
+            url: Page URL
+            response: Response the events were extracted from
+            events: Extracted events
+        """
+        if not self.cache_manager:
+            return
+
+        page_validators = {}
+        if response.headers.get('ETag'):
+            page_validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            page_validators['If-Modified-Since'] = response.headers['Last-Modified']
+
+        if page_validators:
+            self.cache_manager.cache_url_response(
+                url,
+                {'validators': page_validators, 'events': events},
+                expire=self.http_cache_ttl
+            )
+
+    async def _fetch_with_httpx(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        timeout: int = 15,
+        cached_page: Optional[Dict] = None
+    ) -> Tuple[Optional[httpx.Response], Optional[bytes]]:
+        """
+        Fetch HTML with the async HTTP client
+
+        Mirrors _fetch_with_requests: the body is streamed as raw bytes and
+        capped at the configured page size. The politeness delay is left to
+        the caller so it can be served outside the concurrency limit.
+
+        Args:
+            client: Shared async client
+            url: Target URL
+            timeout: Request timeout
+            cached_page: Cached page whose validators make the request conditional
+
+        Returns:
+            Tuple of (response, body); the response has status 304 and no
+            body if the cached page is still current, both are None on error
+        """
+        headers = None
+        if cached_page:
+            headers = cached_page['validators']
+
+        try:
+            async with client.stream('GET', url, headers=headers, timeout=timeout, follow_redirects=True) as response:
+                # Not modified: no body was sent
+                if cached_page and response.status_code == 304:
+                    return response, None
+
+                response.raise_for_status()
+                body = await self._read_body_async(response, url)
+
+            return response, body
+
+        except httpx.HTTPError as e:
+            self.logger.error(f"Request failed for {url}: {e}")
+            return None, None
+
+    async def _fetch_with_playwright(
+        self,
+        playwright_manager: 'PlaywrightManager',
+        url: str
+    ) -> Optional[str]:
+        """
+        Fetch rendered HTML using Playwright
+
+        Args:
+            playwright_manager: Shared PlaywrightManager
+            url: Target URL
+
+        Returns:
+            HTML content or None
+        """
+        try:
+            return await playwright_manager.fetch_page(url, user_agent=self._headers.get('User-Agent'))
+        except Exception as e:
+            self.logger.error(f"Playwright fetch failed for {url}: {e}")
             return None
 
     def _fetch_with_selenium(self, url: str) -> Optional[str]:
@@ -171,8 +708,19 @@ class WebScraper:
         """
         events = []
 
+        # JSON-LD scripts and links are gathered in one walk of the tree and
+        # shared by the strategies that need them
+        scripts = []
+        links = []
+        for tag in soup.find_all(['script', 'a']):
+            if tag.name == 'a':
+                if tag.get('href') is not None and len(links) < _MAX_PATTERN_LINKS:
+                    links.append(tag)
+            elif tag.get('type') == 'application/ld+json':
+                scripts.append(tag)
+
         # Strategy 1: Schema.org structured data
-        schema_events = self._extract_schema_org_events(soup, base_url)
+        schema_events = self._extract_schema_org_events(soup, base_url, scripts)
         if schema_events:
             events.extend(schema_events)
             self.logger.debug(f"Found {len(schema_events)} events via Schema.org")
@@ -184,20 +732,36 @@ class WebScraper:
             self.logger.debug(f"Found {len(container_events)} events via containers")
 
         # Strategy 3: Event listing patterns
-        pattern_events = self._extract_from_patterns(soup, base_url)
+        pattern_events = self._extract_from_patterns(soup, base_url, links)
         if pattern_events:
             events.extend(pattern_events)
             self.logger.debug(f"Found {len(pattern_events)} events via patterns")
 
-        return events
+        # Strategies often find the same event; keep the first occurrence
+        unique_events = []
+        seen = set()
+        for event in events:
+            key = (event.get('title'), event.get('start_date'), event.get('event_url'))
+            if key in seen:
+                continue
+            seen.add(key)
+            unique_events.append(event)
 
-    def _extract_schema_org_events(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+        return unique_events
+
+    def _extract_schema_org_events(
+        self,
+        soup: BeautifulSoup,
+        base_url: str,
+        json_ld_scripts: Optional[List[Tag]] = None
+    ) -> List[Dict]:
         """
         Extract events from Schema.org JSON-LD or microdata
 
         Args:
             soup: BeautifulSoup parsed HTML
             base_url: Base URL
+            json_ld_scripts: JSON-LD script elements, if already collected
 
         Returns:
             List of events
@@ -206,12 +770,17 @@ class WebScraper:
 
         try:
             # Find JSON-LD scripts
-            json_ld_scripts = soup.find_all('script', {'type': 'application/ld+json'})
+            if json_ld_scripts is None:
+                json_ld_scripts = soup.find_all('script', {'type': 'application/ld+json'})
 
             for script in json_ld_scripts:
                 try:
-                    import json
-                    data = json.loads(script.string)
+                    # get_text() joins every text node (.string is None when
+                    # there are several) and returns a plain str for orjson
+                    raw = _JSON_LD_WRAPPER_RE.sub('', script.get_text())
+                    if not raw.strip():
+                        continue
+                    data = orjson.loads(raw)
 
                     # Handle single object or array
                     if isinstance(data, dict):
@@ -225,6 +794,8 @@ class WebScraper:
                                 if event:
                                     events.append(event)
 
+                except orjson.JSONDecodeError as e:
+                    self.logger.debug(f"Invalid JSON-LD: {e}")
                 except Exception as e:
                     self.logger.debug(f"Failed to parse JSON-LD: {e}")
 
@@ -233,7 +804,7 @@ class WebScraper:
 
         return events
 
-    def _parse_schema_event(self, data: Dict, base_url: str) -> Optional[Dict]:
+    def _parse_schema_event(self, data: Dict, base_url: str) -> Optional[Dict[str, Optional[str]]]:
         """
         Parse Schema.org event data
 
@@ -245,28 +816,18 @@ class WebScraper:
             Event dictionary
         """
         try:
-            event = {
-                'title': data.get('name'),
-                'description': data.get('description'),
-                'start_date': None,
-                'end_date': None,
-                'venue_name': None,
-                'venue_address': None,
-                'image_url': None,
-                'event_url': None,
-                'price': None,
-                'organizer_name': None
-            }
-
-            # Start date
-            start_date = data.get('startDate')
-            if start_date:
-                event['start_date'] = self._parse_date(start_date)
-
-            # End date
-            end_date = data.get('endDate')
-            if end_date:
-                event['end_date'] = self._parse_date(end_date)
+            event = dict(_SCHEMA_EVENT_DEFAULTS)
+
+            # Scalar fields: name, description, dates, URL
+            for key, field, kind in _SCHEMA_FIELDS:
+                value = data.get(key)
+                if not value:
+                    continue
+                if kind == 'date':
+                    value = self._parse_date(value)
+                elif kind == 'url':
+                    value = _join_url(base_url, value)
+                event[field] = value
 
             # Location
             location = data.get('location', {})
@@ -282,16 +843,11 @@ class WebScraper:
             image = data.get('image')
             if image:
                 if isinstance(image, str):
-                    event['image_url'] = urljoin(base_url, image)
+                    event['image_url'] = _join_url(base_url, image)
                 elif isinstance(image, list) and image:
-                    event['image_url'] = urljoin(base_url, image[0])
+                    event['image_url'] = _join_url(base_url, image[0])
                 elif isinstance(image, dict):
-                    event['image_url'] = urljoin(base_url, image.get('url', ''))
-
-            # URL
-            url = data.get('url')
-            if url:
-                event['event_url'] = urljoin(base_url, url)
+                    event['image_url'] = _join_url(base_url, image.get('url', ''))
 
             # Organizer
             organizer = data.get('organizer', {})
@@ -324,27 +880,21 @@ class WebScraper:
         """
         events = []
 
-        # Common event container selectors
-        container_selectors = [
-            {'class': lambda x: x and any(kw in ' '.join(x).lower() for kw in ['event', 'listing'])},
-            {'data-type': 'event'},
-            {'itemtype': lambda x: x and 'Event' in x},
-        ]
+        # One pass over the tree; each container is returned once even if it
+        # matches several of the patterns
+        containers = soup.select(_CONTAINER_SELECTOR)
 
-        for selector in container_selectors:
-            containers = soup.find_all(['div', 'article', 'li'], selector)
-
-            for container in containers:
-                try:
-                    event = self._extract_event_from_container(container, base_url)
-                    if event and event.get('title'):
-                        events.append(event)
-                except Exception as e:
-                    self.logger.debug(f"Failed to extract from container: {e}")
+        for container in containers:
+            try:
+                event = self._extract_event_from_container(container, base_url)
+                if event and event.get('title'):
+                    events.append(event)
+            except Exception as e:
+                self.logger.debug(f"Failed to extract from container: {e}")
 
         return events
 
-    def _extract_event_from_container(self, container, base_url: str) -> Dict:
+    def _extract_event_from_container(self, container: Tag, base_url: str) -> Dict[str, Optional[str]]:
         """
         Extract event data from a container element
 
@@ -364,48 +914,101 @@ class WebScraper:
             'venue_name': None
         }
 
+        found = self._index_container(container)
+
         # Title
-        title_elem = container.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=lambda x: x and 'title' in x.lower())
-        if not title_elem:
-            title_elem = container.find(['h1', 'h2', 'h3', 'h4'])
+        title_elem = found.get('title') or found.get('heading')
         if title_elem:
             event['title'] = title_elem.get_text(strip=True)
 
         # URL
-        link_elem = container.find('a', href=True)
+        link_elem = found.get('link')
         if link_elem:
-            event['event_url'] = urljoin(base_url, link_elem['href'])
+            event['event_url'] = _join_url(base_url, link_elem['href'])
 
         # Image
-        img_elem = container.find('img', src=True)
+        img_elem = found.get('image')
         if img_elem:
-            event['image_url'] = urljoin(base_url, img_elem['src'])
+            event['image_url'] = _join_url(base_url, img_elem['src'])
 
         # Date
-        date_elem = container.find(class_=lambda x: x and 'date' in x.lower())
+        date_elem = found.get('date')
         if date_elem:
             date_text = date_elem.get_text(strip=True)
             event['start_date'] = self._parse_date(date_text)
 
         # Description
-        desc_elem = container.find(['p', 'div'], class_=lambda x: x and any(kw in x.lower() for kw in ['description', 'excerpt', 'summary']))
+        desc_elem = found.get('description')
         if desc_elem:
             event['description'] = desc_elem.get_text(strip=True)
 
         # Venue
-        venue_elem = container.find(class_=lambda x: x and any(kw in x.lower() for kw in ['venue', 'location']))
+        venue_elem = found.get('venue')
         if venue_elem:
             event['venue_name'] = venue_elem.get_text(strip=True)
 
         return event
 
-    def _extract_from_patterns(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def _index_container(self, container: Tag) -> Dict[str, Tag]:
+        """
+        Find the first element of each event field in one walk of a container
+
+        Args:
+            container: BeautifulSoup element
+
+        Returns:
+            Dictionary mapping field names ('title', 'heading', 'link',
+            'image', 'date', 'description', 'venue') to the first matching
+            element, in document order
+        """
+        found: Dict[str, Tag] = {}
+
+        # Walk lazily so the scan really stops once every field is found
+        for elem in container.descendants:
+            if not isinstance(elem, Tag):
+                continue
+
+            name = elem.name
+            attrs = elem.attrs
+            classes = attrs.get('class')
+            class_str = ' '.join(classes) if classes else ''
+
+            if name in _HEADING_TAGS:
+                found.setdefault('heading', elem)
+            if name == 'a' and 'link' not in found and attrs.get('href') is not None:
+                found['link'] = elem
+            elif name == 'img' and 'image' not in found and attrs.get('src') is not None:
+                found['image'] = elem
+
+            if class_str:
+                for match in _FIELD_CLASS_RE.finditer(class_str):
+                    field = match.lastgroup
+                    if field in found:
+                        continue
+                    if field == 'title' and not (name in _HEADING_TAGS or name == 'a'):
+                        continue
+                    if field == 'description' and name not in ('p', 'div'):
+                        continue
+                    found[field] = elem
+
+            if len(found) == _CONTAINER_FIELD_COUNT:
+                break
+
+        return found
+
+    def _extract_from_patterns(
+        self,
+        soup: BeautifulSoup,
+        base_url: str,
+        links: Optional[List[Tag]] = None
+    ) -> List[Dict]:
         """
         Extract events using common pattern matching
 
         Args:
             soup: BeautifulSoup parsed HTML
             base_url: Base URL
+            links: Link elements with an href, if already collected
 
         Returns:
             List of events
@@ -415,27 +1018,42 @@ class WebScraper:
         # Look for common event listing patterns
         # This is a simplified version - could be expanded significantly
 
-        # Find all links that might be events
-        links = soup.find_all('a', href=True)
+        # Find links that might be events, capped for pathological pages
+        if links is None:
+            links = soup.find_all('a', href=True, limit=_MAX_PATTERN_LINKS)
+
+        seen = set()
 
         for link in links:
             href = link['href']
+
+            # Check if URL pattern suggests an event before extracting text
+            if not _EVENT_HREF_RE.search(href):
+                continue
+
             text = link.get_text(strip=True)
 
             # Skip if too short or clearly not an event
             if len(text) < 10 or not text:
                 continue
 
-            # Check if URL pattern suggests an event
-            event_keywords = ['event', 'concert', 'show', 'festival', 'exhibition', 'conference']
-            if any(keyword in href.lower() for keyword in event_keywords):
-                event = {
-                    'title': text,
-                    'event_url': urljoin(base_url, href)
-                }
-                events.append(event)
+            # The same link often appears several times (navigation, cards)
+            key = (text, href)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            event = {
+                'title': text,
+                'event_url': _join_url(base_url, href)
+            }
+            events.append(event)
+
+            # Limit to avoid too many false positives
+            if len(events) >= 50:
+                break
 
-        return events[:50]  # Limit to avoid too many false positives
+        return events
 
     def _parse_date(self, date_str: str) -> Optional[str]:
         """
@@ -447,23 +1065,18 @@ class WebScraper:
         Returns:
             ISO formatted date string or None
         """
-        if not date_str:
+        if not date_str or not isinstance(date_str, str):
             return None
 
-        try:
-            from dateutil import parser
-            dt = parser.parse(date_str, fuzzy=True)
-            return dt.isoformat()
-        except Exception as e:
-            self.logger.debug(f"Failed to parse date '{date_str}': {e}")
-            return None
+        return _parse_date_cached(date_str)
 
-    def extract_open_graph_data(self, soup: BeautifulSoup, base_url: str) -> Dict:
+    def extract_open_graph_data(self, soup: Union[BeautifulSoup, str], base_url: str) -> Dict:
         """
         Extract Open Graph metadata
 
         Args:
-            soup: BeautifulSoup parsed HTML
+            soup: BeautifulSoup parsed HTML, or raw HTML to parse only the
+                <meta> elements of
             base_url: Base URL
 
         Returns:
@@ -472,24 +1085,61 @@ class WebScraper:
         og_data = {}
 
         try:
-            og_tags = soup.find_all('meta', property=lambda x: x and x.startswith('og:'))
+            if isinstance(soup, str):
+                soup = self._parse_html(soup, parse_only=_META_STRAINER)
+
+            og_tags = soup.select(_OG_META_SELECTOR)
 
             for tag in og_tags:
-                property_name = tag.get('property', '').replace('og:', '')
+                property_name = tag['property'][3:]
                 content = tag.get('content', '')
 
                 if property_name and content:
                     og_data[property_name] = content
 
                     # Resolve relative URLs
-                    if property_name in ['image', 'url'] and content:
-                        og_data[property_name] = urljoin(base_url, content)
+                    if property_name in ['image', 'url']:
+                        og_data[property_name] = _join_url(base_url, content)
 
         except Exception as e:
             self.logger.debug(f"Failed to extract Open Graph data: {e}")
 
         return og_data
 
+    async def health_check_many(
+        self,
+        urls: List[str],
+        concurrency: int = 16,
+        timeout: int = 5
+    ) -> Dict[str, bool]:
+        """
+        Check several URLs concurrently
+
+        Args:
+            urls: URLs to check
+            concurrency: Maximum number of checks in flight
+            timeout: Timeout in seconds per check
+
+        Returns:
+            Dictionary mapping each URL to whether it is accessible
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        verify_ssl = self.config.get('health_check', {}).get('verify_ssl', True)
+
+        async def check_one(client: httpx.AsyncClient, url: str) -> bool:
+            async with semaphore:
+                try:
+                    response = await client.head(url, timeout=timeout, follow_redirects=True)
+                    return response.status_code < 400
+                except Exception as e:
+                    self.logger.debug(f"Health check failed for {url}: {e}")
+                    return False
+
+        async with httpx.AsyncClient(headers=self._headers, verify=verify_ssl) as client:
+            results = await asyncio.gather(*(check_one(client, url) for url in urls))
+
+        return dict(zip(urls, results))
+
     def health_check(self, url: str, timeout: int = 5) -> bool:
         """
         Check if URL is accessible
@@ -502,7 +1152,7 @@ class WebScraper:
             True if accessible, False otherwise
         """
         try:
-            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+            response = self.session.head(url, headers=self._headers, timeout=timeout, allow_redirects=True)
             return response.status_code < 400
         except Exception as e:
             self.logger.debug(f"Health check failed for {url}: {e}")